@@ -6,8 +6,9 @@ used throughout the video transcriber application. Each class groups related set
 for better organization and maintainability.
 """
 
+import functools
 import os
-from typing import List, Set
+from typing import List, Optional, Set, Tuple
 
 
 class AppConfig:
@@ -107,22 +108,31 @@ class AppConfig:
         Returns:
             List of allowed CORS origins
         """
-        if cls.is_debug():
+        debug = cls.is_debug()
+        # The configured origins only matter outside debug mode
+        raw_origins = None if debug else os.getenv("CORS_ALLOWED_ORIGINS")
+        return list(cls._cors_origins_cached(debug, raw_origins))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _cors_origins_cached(
+        debug: bool, raw_origins: Optional[str]
+    ) -> Tuple[str, ...]:
+        """Parse the CORS origins, memoized per (DEBUG, CORS_ALLOWED_ORIGINS)."""
+        if debug:
             # In debug mode, allow common development origins
-            return [
+            return (
                 "http://localhost:3000",  # React dev server
                 "http://localhost:5000",  # Flask dev server alt port
                 "http://localhost:5001",  # Main Flask server
                 "http://127.0.0.1:5001",  # Localhost IP variant
-            ]
-        else:
-            # In production, only allow explicitly configured origins
-            cors_origins = os.getenv(
-                "CORS_ALLOWED_ORIGINS",
-                "http://localhost:5001",  # Default fallback for production
             )
-            origins = cors_origins.split(",")
-            return [origin.strip() for origin in origins if origin.strip()]
+
+        # In production, only allow explicitly configured origins
+        if raw_origins is None:
+            raw_origins = "http://localhost:5001"  # Default fallback for production
+        origins = raw_origins.split(",")
+        return tuple(origin.strip() for origin in origins if origin.strip())
 
     # Legacy property for backwards compatibility
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
@@ -70,18 +70,30 @@ class CorrectionSession:
 class TranscriptCorrectionEngine:
     """Main engine for automated transcript correction and quality assessment."""
 
-    def __init__(self, custom_dictionary: Optional[Dict[str, str]] = None):
-        """Initialize the correction engine with optional custom dictionary."""
+    def __init__(
+        self,
+        custom_dictionary: Optional[Dict[str, str]] = None,
+        nlp_model: Optional[Any] = None,
+    ):
+        """
+        Initialize the correction engine with optional custom dictionary.
+
+        Args:
+            custom_dictionary: Optional mapping of terms to their corrections
+            nlp_model: Optional pre-loaded spaCy pipeline; loaded from
+                en_core_web_sm when not provided
+        """
         self.custom_dictionary = custom_dictionary or {}
         self.user_corrections: Dict[str, str] = {}  # Learn from user corrections
         self.grammar_tool = None
-        self.nlp_model = None
+        self.nlp_model = nlp_model
         self.correction_sessions: Dict[str, Any] = {}  # Track correction sessions
 
         if CORRECTION_AVAILABLE:
             try:
                 self.grammar_tool = language_tool_python.LanguageTool("en-US")
-                self.nlp_model = spacy.load("en_core_web_sm")
+                if self.nlp_model is None:
+                    self.nlp_model = spacy.load("en_core_web_sm")
                 logger.info("Correction engine initialized successfully")
             except Exception as e:
                 logger.warning(f"Could not initialize correction tools: {e}")
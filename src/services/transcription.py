@@ -63,6 +63,16 @@ analysis_config = AnalysisConfig()
 # Patterns are now configured in AnalysisConfig
 
 
+def _compile_any(patterns: List[str]) -> "re.Pattern[str]":
+    """Fold a list of regex patterns into one case-insensitive alternation."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# A segment only needs to match one pattern, so each list is searched once
+_QUESTION_RE = _compile_any(analysis_config.QUESTION_PATTERNS)
+_EMPHASIS_RE = _compile_any(analysis_config.EMPHASIS_PATTERNS)
+
+
 def init_worker() -> None:
     """
     Initialize worker process for parallel transcription.
@@ -647,31 +657,25 @@ class VideoTranscriber:
             if keyword.lower() in word_freq:
                 analysis["keyword_frequency"][keyword] = word_freq[keyword.lower()]
 
-        # Find questions in segments
-        for segment in segments:
-            for question_pattern in analysis_config.QUESTION_PATTERNS:
-                if re.search(question_pattern, segment["text"], re.IGNORECASE):
-                    analysis["questions"].append(
-                        {
-                            "timestamp": segment["timestamp_str"],
-                            "text": segment["text"].strip(),
-                            "start": segment["start"],
-                        }
-                    )
-                    break
-
-        # Find emphasis cues
+        # Find questions and emphasis cues in segments
         for segment in segments:
-            for emphasis_pattern in analysis_config.EMPHASIS_PATTERNS:
-                if re.search(emphasis_pattern, segment["text"], re.IGNORECASE):
-                    analysis["emphasis_cues"].append(
-                        {
-                            "timestamp": segment["timestamp_str"],
-                            "text": segment["text"].strip(),
-                            "start": segment["start"],
-                        }
-                    )
-                    break
+            segment_text = segment["text"]
+            if _QUESTION_RE.search(segment_text):
+                analysis["questions"].append(
+                    {
+                        "timestamp": segment["timestamp_str"],
+                        "text": segment_text.strip(),
+                        "start": segment["start"],
+                    }
+                )
+            if _EMPHASIS_RE.search(segment_text):
+                analysis["emphasis_cues"].append(
+                    {
+                        "timestamp": segment["timestamp_str"],
+                        "text": segment_text.strip(),
+                        "start": segment["start"],
+                    }
+                )
 
         return analysis
 
@@ -25,6 +25,7 @@ from .session import (
     ensure_session_exists,
     get_session_list,
     validate_session_access,
+    validate_session_access_batch,
     validate_session_for_socket,
 )
 from .validation import (
@@ -53,6 +54,7 @@ __all__ = [
     "handle_user_friendly_error",
     # Session management
     "validate_session_access",
+    "validate_session_access_batch",
     "ensure_session_exists",
     "validate_session_for_socket",
     "get_session_list",
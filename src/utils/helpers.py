@@ -8,14 +8,16 @@ from typing import Dict
 
 logger = logging.getLogger(__name__)
 
+# Allow alphanumeric, underscores, hyphens, and spaces
+_SESSION_ID_RE = re.compile(r"^[a-zA-Z0-9_\-\s]+$")
+
 
 def is_valid_session_id(session_id: str) -> bool:
     """Validate session_id to prevent path traversal attacks."""
     if not session_id or not isinstance(session_id, str):
         return False
-    # Allow alphanumeric, underscores, hyphens, and spaces
-    # but prevent path traversal sequences
-    return bool(re.match(r"^[a-zA-Z0-9_\-\s]+$", session_id)) and ".." not in session_id
+    # Prevent path traversal sequences as well as disallowed characters
+    return bool(_SESSION_ID_RE.match(session_id)) and ".." not in session_id
 
 
 def is_safe_path(file_path: str, base_dir: str) -> bool:
@@ -52,17 +54,19 @@ def load_session_metadata(session_folder: str, session_path: str) -> Dict[str, s
     """
     metadata_file = os.path.join(session_path, "metadata.json")
 
-    if os.path.exists(metadata_file):
-        try:
-            with open(metadata_file, "r") as f:
-                metadata = json.load(f)
-                logger.debug(f"Loaded metadata from file for session {session_folder}")
-                return metadata
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(
-                f"Failed to load metadata file for session {session_folder}: {e}"
-            )
-            # Fall back to parsing from folder name
+    # Open directly rather than checking existence first to save a stat call
+    try:
+        with open(metadata_file, "r") as f:
+            metadata = json.load(f)
+            logger.debug(f"Loaded metadata from file for session {session_folder}")
+            return metadata
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(
+            f"Failed to load metadata file for session {session_folder}: {e}"
+        )
+        # Fall back to parsing from folder name
 
     # Parse metadata from folder name (legacy sessions)
     metadata = parse_session_metadata(session_folder, session_path)
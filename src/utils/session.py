@@ -7,7 +7,7 @@ to eliminate duplicate code across routes and services.
 
 import logging
 import os
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from src.config import AppConfig
 from src.models.exceptions import UserFriendlyError
@@ -17,6 +17,32 @@ logger = logging.getLogger(__name__)
 config = AppConfig()
 
 
+def _session_path_if_valid(
+    session_id: str, results_folder: str, base_path: str
+) -> Optional[str]:
+    """
+    Return the session path if the ID is valid and stays inside the folder.
+
+    Args:
+        session_id: Session identifier to validate
+        results_folder: Results folder the session path is built from
+        base_path: Absolute path of the results folder
+
+    Returns:
+        Session path, or None if the ID is invalid or the path escapes
+    """
+    if not is_valid_session_id(session_id):
+        return None
+
+    session_path = os.path.join(results_folder, session_id)
+
+    # Ensure the path is within the results folder (prevent path traversal)
+    if not os.path.abspath(session_path).startswith(base_path):
+        return None
+
+    return session_path
+
+
 def validate_session_access(session_id: str, results_folder: str = None) -> str:
     """
     Validate session ID and return session path.
@@ -34,21 +60,48 @@ def validate_session_access(session_id: str, results_folder: str = None) -> str:
     Raises:
         UserFriendlyError: If session ID is invalid or path is unsafe
     """
-    if not is_valid_session_id(session_id):
-        raise UserFriendlyError("Invalid session ID")
-
     if results_folder is None:
         results_folder = config.RESULTS_FOLDER
 
-    session_path = os.path.join(results_folder, session_id)
-
-    # Ensure the path is within the results folder (prevent path traversal)
-    if not os.path.abspath(session_path).startswith(os.path.abspath(results_folder)):
+    session_path = _session_path_if_valid(
+        session_id, results_folder, os.path.abspath(results_folder)
+    )
+    if session_path is None:
+        if not is_valid_session_id(session_id):
+            raise UserFriendlyError("Invalid session ID")
         raise UserFriendlyError("Invalid session path")
 
     return session_path
 
 
+def validate_session_access_batch(
+    session_ids: Sequence[str], results_folder: str = None
+) -> List[bool]:
+    """
+    Validate many session IDs at once.
+
+    Applies the same checks as validate_session_access to each ID, but
+    resolves the results folder only once and reports failures as False
+    instead of raising.
+
+    Args:
+        session_ids: Session identifiers to validate
+        results_folder: Optional results folder path (uses config default if None)
+
+    Returns:
+        List of booleans, True where the matching session ID is valid
+    """
+    if results_folder is None:
+        results_folder = config.RESULTS_FOLDER
+
+    base_path = os.path.abspath(results_folder)
+
+    return [
+        _session_path_if_valid(session_id, results_folder, base_path) is not None
+        for session_id in session_ids
+    ]
+
+
 def ensure_session_exists(
     session_id: str, results_folder: str = None
 ) -> Tuple[str, Dict[str, Any]]:
@@ -114,16 +167,17 @@ def get_session_list(results_folder: str = None) -> list:
         return []
 
     sessions_list = []
-    for session_folder in os.listdir(results_folder):
-        session_path = os.path.join(results_folder, session_folder)
-        if os.path.isdir(session_path):
+    # scandir exposes the entry type from the directory listing itself, so
+    # non-session files are skipped without an extra stat per entry
+    with os.scandir(results_folder) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
             try:
-                metadata = load_session_metadata(session_folder, session_path)
+                metadata = load_session_metadata(entry.name, entry.path)
                 sessions_list.append(metadata)
             except Exception as e:
-                logger.warning(
-                    f"Failed to load metadata for session {session_folder}: {e}"
-                )
+                logger.warning(f"Failed to load metadata for session {entry.name}: {e}")
 
     # Sort by creation time (newest first)
     sessions_list.sort(key=lambda x: x.get("created_at", ""), reverse=True)
@@ -5,10 +5,11 @@ This module provides centralized validation functions for request data,
 file uploads, and common input validation patterns.
 """
 
+import functools
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 from werkzeug.datastructures import FileStorage
 
@@ -19,6 +20,12 @@ logger = logging.getLogger(__name__)
 config = AppConfig()
 
 
+@functools.lru_cache(maxsize=64)
+def _required_field_set(fields: Tuple[str, ...]) -> FrozenSet[str]:
+    """Return the required fields as a frozenset, memoized per schema."""
+    return frozenset(fields)
+
+
 def validate_request_data(data: Dict[str, Any], required_fields: List[str]) -> None:
     """
     Validate request data contains all required fields.
@@ -33,10 +40,14 @@ def validate_request_data(data: Dict[str, Any], required_fields: List[str]) -> N
     if not data:
         raise UserFriendlyError("Invalid request: JSON data is required")
 
-    missing_fields = []
-    for field in required_fields:
-        if field not in data:
-            missing_fields.append(field)
+    required_set = _required_field_set(tuple(required_fields))
+
+    # Common case: a single subset check against the dict's keys
+    if isinstance(data, dict) and required_set <= data.keys():
+        return
+
+    # Preserve the caller's field order in the error message
+    missing_fields = [field for field in required_fields if field not in data]
 
     if missing_fields:
         field_list = "', '".join(missing_fields)
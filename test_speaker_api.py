@@ -22,6 +22,9 @@ logger = logging.getLogger(__name__)
 class SpeakerAPITester:
     """Test speaker diarization API endpoints"""
 
+    # One report row per test; the blank line between rows comes from the join
+    REPORT_ROW_FMT = "{status} {name}\n     {description}\n{error}{details}"
+
     def __init__(self, base_url="http://localhost:5001"):
         self.base_url = base_url
         self.api_base = f"{base_url}/api/speaker"
@@ -599,50 +602,73 @@ class SpeakerAPITester:
 
     def print_final_report(self, results):
         """Print comprehensive test report"""
-        print(f"\n{'='*60}")
-        print("🎯 SPEAKER API TEST REPORT")
-        print(f"{'='*60}")
-        print(f"📅 Timestamp: {results['timestamp']}")
-        print(f"📊 Total Tests: {results['total_tests']}")
-        print(f"✅ Passed: {results['passed_tests']}")
-        print(f"❌ Failed: {results['failed_tests']}")
-        print(f"📈 Success Rate: {results['success_rate']:.1f}%")
-        print(f"🎯 Overall Status: {results['overall_status']}")
-
-        print(f"\n{'='*40}")
-        print("📋 DETAILED RESULTS")
-        print(f"{'='*40}")
+        lines = [
+            f"\n{'='*60}",
+            "🎯 SPEAKER API TEST REPORT",
+            f"{'='*60}",
+            f"📅 Timestamp: {results['timestamp']}",
+            f"📊 Total Tests: {results['total_tests']}",
+            f"✅ Passed: {results['passed_tests']}",
+            f"❌ Failed: {results['failed_tests']}",
+            f"📈 Success Rate: {results['success_rate']:.1f}%",
+            f"🎯 Overall Status: {results['overall_status']}",
+            f"\n{'='*40}",
+            "📋 DETAILED RESULTS",
+            f"{'='*40}",
+        ]
 
         for result in results["test_results"]:
-            status = "✅ PASS" if result["success"] else "❌ FAIL"
-            print(f"{status} {result['test_name']}")
-            print(f"     {result['description']}")
-
-            if not result["success"] and "error" in result:
-                print(f"     Error: {result['error']}")
-
-            if "details" in result:
-                for key, value in result["details"].items():
-                    print(f"     {key}: {value}")
-            print()
+            error = (
+                f"     Error: {result['error']}\n"
+                if not result["success"] and "error" in result
+                else ""
+            )
+            details = "".join(
+                f"     {key}: {value}\n"
+                for key, value in result.get("details", {}).items()
+            )
+            lines.append(
+                self.REPORT_ROW_FMT.format(
+                    status="✅ PASS" if result["success"] else "❌ FAIL",
+                    name=result["test_name"],
+                    description=result["description"],
+                    error=error,
+                    details=details,
+                )
+            )
 
-        print(f"{'='*60}")
+        lines.append(f"{'='*60}")
 
         # Recommendations
-        print(f"\n🔧 RECOMMENDATIONS:")
+        lines.append("\n🔧 RECOMMENDATIONS:")
         if results["success_rate"] < 50:
-            print("❗ Critical: Multiple API failures detected")
-            print("   - Check server configuration")
-            print("   - Verify speaker diarization service initialization")
-            print("   - Review error logs for detailed information")
+            lines.extend(
+                [
+                    "❗ Critical: Multiple API failures detected",
+                    "   - Check server configuration",
+                    "   - Verify speaker diarization service initialization",
+                    "   - Review error logs for detailed information",
+                ]
+            )
         elif results["success_rate"] < 80:
-            print("⚠️ Warning: Some API tests failed")
-            print("   - Review failed endpoints above")
-            print("   - Consider additional error handling")
+            lines.extend(
+                [
+                    "⚠️ Warning: Some API tests failed",
+                    "   - Review failed endpoints above",
+                    "   - Consider additional error handling",
+                ]
+            )
         else:
-            print("🎉 Excellent: Speaker API is working well!")
-            print("   - Ready for integration with UI")
-            print("   - Consider adding performance monitoring")
+            lines.extend(
+                [
+                    "🎉 Excellent: Speaker API is working well!",
+                    "   - Ready for integration with UI",
+                    "   - Consider adding performance monitoring",
+                ]
+            )
+
+        # Emit the whole report with a single write instead of one print per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
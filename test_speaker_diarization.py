@@ -30,6 +30,9 @@ except ImportError as e:
 class SpeakerDiarizationTester:
     """Comprehensive testing for speaker diarization functionality"""
 
+    # One report row per test; the blank line between rows comes from the join
+    REPORT_ROW_FMT = "{status} {name}\n     {description}\n{error}{details}"
+
     def __init__(self):
         self.diarization_service = SpeakerDiarizationService(
             use_mock=True
@@ -800,51 +803,74 @@ class SpeakerDiarizationTester:
 
     def print_final_report(self, results: Dict[str, Any]):
         """Print comprehensive test report"""
-        print(f"\n{'='*60}")
-        print("🎯 SPEAKER DIARIZATION TEST REPORT")
-        print(f"{'='*60}")
-        print(f"📅 Timestamp: {results['timestamp']}")
-        print(f"📊 Total Tests: {results['total_tests']}")
-        print(f"✅ Passed: {results['passed_tests']}")
-        print(f"❌ Failed: {results['failed_tests']}")
-        print(f"📈 Success Rate: {results['success_rate']:.1f}%")
-        print(f"🎯 Overall Status: {results['overall_status']}")
-
-        print(f"\n{'='*40}")
-        print("📋 DETAILED RESULTS")
-        print(f"{'='*40}")
+        lines = [
+            f"\n{'='*60}",
+            "🎯 SPEAKER DIARIZATION TEST REPORT",
+            f"{'='*60}",
+            f"📅 Timestamp: {results['timestamp']}",
+            f"📊 Total Tests: {results['total_tests']}",
+            f"✅ Passed: {results['passed_tests']}",
+            f"❌ Failed: {results['failed_tests']}",
+            f"📈 Success Rate: {results['success_rate']:.1f}%",
+            f"🎯 Overall Status: {results['overall_status']}",
+            f"\n{'='*40}",
+            "📋 DETAILED RESULTS",
+            f"{'='*40}",
+        ]
 
         for result in results["test_results"]:
-            status = "✅ PASS" if result["success"] else "❌ FAIL"
-            print(f"{status} {result['test_name']}")
-            print(f"     {result['description']}")
-
-            if not result["success"] and "error" in result:
-                print(f"     Error: {result['error']}")
-
-            if "details" in result:
-                for key, value in result["details"].items():
-                    print(f"     {key}: {value}")
-            print()
+            error = (
+                f"     Error: {result['error']}\n"
+                if not result["success"] and "error" in result
+                else ""
+            )
+            details = "".join(
+                f"     {key}: {value}\n"
+                for key, value in result.get("details", {}).items()
+            )
+            lines.append(
+                self.REPORT_ROW_FMT.format(
+                    status="✅ PASS" if result["success"] else "❌ FAIL",
+                    name=result["test_name"],
+                    description=result["description"],
+                    error=error,
+                    details=details,
+                )
+            )
 
-        print(f"{'='*60}")
-        print("📁 Results saved to:", self.results_dir)
+        lines.append(f"{'='*60}")
+        lines.append(f"📁 Results saved to: {self.results_dir}")
 
         # Recommendations
-        print(f"\n🔧 RECOMMENDATIONS:")
+        lines.append("\n🔧 RECOMMENDATIONS:")
         if results["success_rate"] < 50:
-            print("❗ Critical: Multiple test failures detected")
-            print("   - Check pyannote.audio installation")
-            print("   - Verify Hugging Face authentication token")
-            print("   - Ensure audio processing dependencies are available")
+            lines.extend(
+                [
+                    "❗ Critical: Multiple test failures detected",
+                    "   - Check pyannote.audio installation",
+                    "   - Verify Hugging Face authentication token",
+                    "   - Ensure audio processing dependencies are available",
+                ]
+            )
         elif results["success_rate"] < 80:
-            print("⚠️ Warning: Some tests failed")
-            print("   - Review failed tests above")
-            print("   - Consider additional audio samples for testing")
+            lines.extend(
+                [
+                    "⚠️ Warning: Some tests failed",
+                    "   - Review failed tests above",
+                    "   - Consider additional audio samples for testing",
+                ]
+            )
         else:
-            print("🎉 Excellent: Speaker diarization is working well!")
-            print("   - Ready for production deployment")
-            print("   - Consider adding UI integration tests")
+            lines.extend(
+                [
+                    "🎉 Excellent: Speaker diarization is working well!",
+                    "   - Ready for production deployment",
+                    "   - Consider adding UI integration tests",
+                ]
+            )
+
+        # Emit the whole report with a single write instead of one print per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -5,19 +5,84 @@ Tests all components: API endpoints, UI integration, and correction engine funct
 """
 
 import requests
+import importlib.util
+import io
 import json
+import threading
 import time
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 # Add src directory to path for direct engine testing
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+
+class _ThreadBufferedStdout:
+    """stdout proxy that sends writes to the calling thread's buffer, if any."""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    @contextmanager
+    def buffered(self):
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = None
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+
+# Building the engine starts a LanguageTool JVM and loads spaCy, so all
+# tests share one instance instead of constructing their own. The spaCy
+# pipeline is loaded once and handed to the engine as well.
+ENGINE = None
+NLP = None
+
+
+def get_nlp():
+    """Return the shared spaCy English pipeline, loading it on first use."""
+    global NLP
+    if NLP is None:
+        import spacy
+        NLP = spacy.load('en_core_web_sm')
+    return NLP
+
+
+def get_engine():
+    """Return the shared TranscriptCorrectionEngine, creating it on first use."""
+    global ENGINE
+    if ENGINE is None:
+        from services.transcript_correction import TranscriptCorrectionEngine
+        try:
+            nlp_model = get_nlp()
+        except Exception:
+            nlp_model = None  # Let the engine report the missing model itself
+        ENGINE = TranscriptCorrectionEngine(nlp_model=nlp_model)
+    return ENGINE
+
+
 class TestTranscriptCorrection:
     """Test suite for transcript correction functionality."""
     
     BASE_URL = "http://127.0.0.1:5001"
     
+    # Tests that only talk to the running server and can overlap engine work
+    HTTP_TESTS = ("Web Interface", "API Endpoints")
+    
+    # Seconds the Medium performance case may take before Long is skipped
+    MEDIUM_SKIP_THRESHOLD = 10
+    
     SAMPLE_TRANSCRIPT = """Hello, welcome to today's meating about artifical inteligence and machine lerning. We're going to discus the latest advancements in AI technolgy and how they effect our bussiness operations.
 
 First, lets talk about natural language procesing. NLP has become incredibley powerfull in recent years, allowing us to analayze large amounts of text data very efectively. However, there are still some chalenges we need to adress.
@@ -31,9 +96,7 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
         print("\n🧪 Testing TranscriptCorrectionEngine directly...")
         
         try:
-            from services.transcript_correction import TranscriptCorrectionEngine
-            
-            engine = TranscriptCorrectionEngine()
+            engine = get_engine()
             assert engine.correction_available, "Correction engine should be available"
             
             # Test quality analysis
@@ -142,18 +205,23 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
         
         all_available = True
         
+        # find_spec only locates the module; importing spaCy etc. is slow and
+        # the model load below already exercises the real import
         for module, description in dependencies:
             try:
-                __import__(module)
+                available = importlib.util.find_spec(module) is not None
+            except (ImportError, ValueError):
+                available = False
+            
+            if available:
                 print(f"✅ {description}")
-            except ImportError:
+            else:
                 print(f"❌ {description} - Not available")
                 all_available = False
         
         # Test spaCy model
         try:
-            import spacy
-            nlp = spacy.load('en_core_web_sm')
+            get_nlp()
             print("✅ spaCy English model")
         except Exception as e:
             print(f"❌ spaCy English model - {e}")
@@ -166,9 +234,7 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
         print("\n🎯 Testing correction accuracy...")
         
         try:
-            from services.transcript_correction import TranscriptCorrectionEngine
-            
-            engine = TranscriptCorrectionEngine()
+            engine = get_engine()
             if not engine.correction_available:
                 print("⚠️  Correction engine not available - skipping accuracy test")
                 return True
@@ -189,12 +255,13 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
                 suggestions = engine.generate_corrections(text)
                 
                 # Check if any suggestion contains the expected correction
-                found_correction = False
-                for suggestion in suggestions:
-                    if expected_word.lower() in suggestion.suggested_text.lower():
-                        found_correction = True
-                        accuracy_count += 1
-                        break
+                expected_lower = expected_word.lower()
+                found_correction = any(
+                    expected_lower in suggestion.suggested_text.lower()
+                    for suggestion in suggestions
+                )
+                if found_correction:
+                    accuracy_count += 1
                 
                 status = "✅" if found_correction else "❌"
                 print(f"{status} '{text}' -> expected '{expected_word}' - {'Found' if found_correction else 'Not found'}")
@@ -213,9 +280,7 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
         print("\n⚡ Testing performance...")
         
         try:
-            from services.transcript_correction import TranscriptCorrectionEngine
-            
-            engine = TranscriptCorrectionEngine()
+            engine = get_engine()
             if not engine.correction_available:
                 print("⚠️  Correction engine not available - skipping performance test")
                 return True
@@ -256,9 +321,24 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
                     'total_time': total_time,
                     'suggestions': len(suggestions)
                 })
+                
+                # A slow Medium run means Long would blow the 30s budget anyway
+                if label == 'Medium' and total_time > self.MEDIUM_SKIP_THRESHOLD:
+                    print("⚠️  Skipping Long case — engine too slow")
+                    performance_results.append({
+                        'label': 'Long',
+                        'length': len(self.SAMPLE_TRANSCRIPT) * 3,
+                        'total_time': 30.1,
+                        'suggestions': 0,
+                        'skipped': True
+                    })
+                    break
             
             # Check if performance is reasonable (under 30 seconds for long text)
-            long_test = next(r for r in performance_results if r['label'] == 'Long')
+            long_test = next(
+                (r for r in performance_results if r['label'] == 'Long'),
+                {'total_time': 30.1}
+            )
             performance_ok = long_test['total_time'] < 30
             
             status = "✅" if performance_ok else "⚠️"
@@ -270,6 +350,22 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
             print(f"❌ Performance test failed: {e}")
             return False
     
+    def _run_tests_buffered(self, tests, stdout):
+        """Run tests in order, returning {name: (result, captured output)}."""
+        outcomes = {}
+        
+        for test_name, test_func in tests:
+            with stdout.buffered() as buffer:
+                print(f"\n{'='*20} {test_name} Test {'='*20}")
+                try:
+                    result = test_func()
+                except Exception as e:
+                    print(f"❌ {test_name} test crashed: {e}")
+                    result = False
+            outcomes[test_name] = (result, buffer.getvalue())
+        
+        return outcomes
+    
     def run_all_tests(self):
         """Run all tests and provide summary."""
         print("🚀 Starting Comprehensive Transcript Correction Tests")
@@ -284,16 +380,28 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
             ("Performance", self.test_performance)
         ]
         
+        # The HTTP tests don't touch the engine, so they run on a worker thread
+        # while the engine tests run here. Each test's output is buffered and
+        # replayed in the original order to keep the report stable.
+        http_tests = [(name, func) for name, func in tests if name in self.HTTP_TESTS]
+        engine_tests = [(name, func) for name, func in tests if name not in self.HTTP_TESTS]
+        
+        stdout = _ThreadBufferedStdout(sys.stdout)
+        sys.stdout = stdout
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                http_future = executor.submit(self._run_tests_buffered, http_tests, stdout)
+                outcomes = self._run_tests_buffered(engine_tests, stdout)
+                outcomes.update(http_future.result())
+        finally:
+            sys.stdout = stdout.stream
+        
         results = []
         
-        for test_name, test_func in tests:
-            print(f"\n{'='*20} {test_name} Test {'='*20}")
-            try:
-                result = test_func()
-                results.append((test_name, result))
-            except Exception as e:
-                print(f"❌ {test_name} test crashed: {e}")
-                results.append((test_name, False))
+        for test_name, _ in tests:
+            result, output = outcomes[test_name]
+            sys.stdout.write(output)
+            results.append((test_name, result))
         
         # Summary
         print("\n" + "="*80)
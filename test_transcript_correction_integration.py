@@ -5,8 +5,6 @@ into the main installation and setup scripts.
 """
 
 import os
-import subprocess
-import sys
 
 
 def test_requirements_integration():
@@ -196,4 +194,4 @@ def main():
 
 if __name__ == "__main__":
     success = main()
-    exit(0 if success else 1)
+    raise SystemExit(0 if success else 1)
@@ -7,11 +7,41 @@ Tests the API endpoints and core features.
 import requests
 import json
 import time
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json(response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def wait_for_server(base_url, timeout=10.0):
+    """Poll the statistics endpoint until the server responds or time runs out."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f"{base_url}/api/correction/statistics", timeout=0.2)
+            return True
+        except requests.RequestException:
+            time.sleep(0.05)
+    return False
+
 
 def test_transcript_correction():
     """Test the transcript correction API endpoints."""
     base_url = "http://127.0.0.1:5001"
     
+    # One keep-alive connection pool for every request in this run
+    sess = requests.Session()
+    sess.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    
     # Sample transcript with errors
     sample_transcript = """Hello, welcome to today's meating about artifical inteligence and machine lerning. We're going to discus the latest advancements in AI technolgy and how they effect our bussiness operations.
 
@@ -27,16 +57,15 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
     # Test 1: Quality Analysis
     print("\n1. Testing Quality Analysis...")
     try:
-        response = requests.post(
+        response = sess.post(
             f"{base_url}/api/correction/quality-analysis",
             json={
                 "transcript": sample_transcript
-            },
-            headers={"Content-Type": "application/json"}
+            }
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = _json(response)
             if result.get('success'):
                 metrics = result.get('quality_metrics', {})
                 print(f"   ✅ Quality analysis successful!")
@@ -63,17 +92,16 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
     # Test 2: Generate Suggestions
     print("\n2. Testing Correction Suggestions...")
     try:
-        response = requests.post(
+        response = sess.post(
             f"{base_url}/api/correction/suggestions",
             json={
                 "transcript": sample_transcript,
                 "session_id": session_id
-            },
-            headers={"Content-Type": "application/json"}
+            }
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = _json(response)
             if result.get('success'):
                 suggestions = result.get('suggestions', [])
                 print(f"   ✅ Generated {len(suggestions)} correction suggestions!")
@@ -104,10 +132,10 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
     # Test 3: Dictionary Information
     print("\n3. Testing Dictionary Features...")
     try:
-        response = requests.get(f"{base_url}/api/correction/dictionaries")
+        response = sess.get(f"{base_url}/api/correction/dictionaries")
         
         if response.status_code == 200:
-            result = response.json()
+            result = _json(response)
             if result.get('success'):
                 dictionaries = result.get('dictionaries', {})
                 print(f"   ✅ Available dictionaries: {list(dictionaries.keys())}")
@@ -125,10 +153,10 @@ In conclustion, while AI has made remarkabel progress, we stil need to be carefu
     # Test 4: Statistics
     print("\n4. Testing Statistics...")
     try:
-        response = requests.get(f"{base_url}/api/correction/statistics")
+        response = sess.get(f"{base_url}/api/correction/statistics")
         
         if response.status_code == 200:
-            result = response.json()
+            result = _json(response)
             if result.get('success'):
                 stats = result.get('statistics', {})
                 print(f"   ✅ Statistics retrieved!")
@@ -158,8 +186,9 @@ if __name__ == "__main__":
     print("Starting transcript correction tests...")
     print("Make sure the application is running on http://127.0.0.1:5001")
     
-    # Wait a moment for the server to be ready
-    time.sleep(2)
+    # Wait for the server to answer instead of sleeping a fixed amount
+    if not wait_for_server("http://127.0.0.1:5001"):
+        print("⚠️  Server did not respond within 10s; running tests anyway")
     
     try:
         test_transcript_correction()
@@ -6,77 +6,146 @@ used across all test modules.
 """
 
 import os
-import shutil
+import queue
 import sys
-import tempfile
-from typing import Any, Dict, Generator
-from unittest.mock import MagicMock, Mock
+import types
+from typing import Any, Dict, Iterator, Mapping
+from unittest.mock import Mock
 
 import pytest
 from flask import Flask
 from flask.testing import FlaskClient
 
-# Mock whisper module to avoid installation issues in tests
-mock_whisper = MagicMock()
-mock_whisper.load_model = Mock(return_value=Mock())
+# Stub whisper module to avoid installation issues in tests; a plain module
+# with plain functions avoids MagicMock's child-mock and call tracking
+_EMPTY_TRANSCRIPTION = types.MappingProxyType({"text": "", "segments": ()})
+
+mock_whisper = types.ModuleType("whisper")
+mock_whisper.load_model = lambda *args, **kwargs: types.SimpleNamespace(
+    transcribe=lambda *args, **kwargs: _EMPTY_TRANSCRIPTION
+)
+mock_whisper.available_models = lambda: []
 sys.modules["whisper"] = mock_whisper
 
 # Import our application components after mocking whisper
-from src.config import (  # noqa: E402
-    AnalysisConfig,
-    AppConfig,
-    MemoryConfig,
-    VideoConfig,
-)
-from src.models import MemoryManager, ModelManager, ProgressiveFileManager  # noqa: E402
-from src.models.progress import ProgressTracker  # noqa: E402
-from src.services.transcription import VideoTranscriber  # noqa: E402
-from src.utils.memory import get_memory_status_safe  # noqa: E402
-from src.utils.session import validate_session_access  # noqa: E402
-from src.utils.validation import validate_file_upload  # noqa: E402
+# (the service and manager classes are imported inside the fixtures that use
+# them, so collection doesn't pay for their transitive imports up front)
+from src.config import AppConfig  # noqa: E402
+
+# Test configuration with safe defaults, built once at import
+_TEST_CONFIG = AppConfig()
+# Override with test-safe values
+_TEST_CONFIG.DEBUG = False
+_TEST_CONFIG.MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10MB for tests
+_TEST_CONFIG.MEMORY_PRESSURE_THRESHOLD = 95  # Higher threshold for tests
 
 
 @pytest.fixture(scope="session")
 def test_config() -> AppConfig:
     """Create test configuration with safe defaults."""
-    config = AppConfig()
-    # Override with test-safe values
-    config.DEBUG = True
-    config.MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10MB for tests
-    config.MEMORY_PRESSURE_THRESHOLD = 95  # Higher threshold for tests
-    return config
+    return _TEST_CONFIG
+
+
+@pytest.fixture(scope="session")
+def _validated_config() -> bool:
+    """Validate all configurations once per test session."""
+    from src.config import validate_configurations
+
+    # Raises on any invalid or inconsistent configuration
+    validate_configurations()
+    return True
 
 
 @pytest.fixture(scope="session")
-def temp_directory() -> Generator[str, None, None]:
+def temp_directory(tmp_path_factory) -> str:
     """Create temporary directory for test files."""
-    temp_dir = tempfile.mkdtemp(prefix="video_transcriber_test_")
-    yield temp_dir
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    # pytest prunes old base temp directories itself, so no rmtree on teardown
+    return str(tmp_path_factory.mktemp("video_transcriber_test"))
+
+
+TEST_DIRECTORY_NAMES = ("uploads", "results", "config", "logs")
+
+
+def _empty_directory(path: str) -> None:
+    """Delete everything inside a directory, leaving the directory itself.
+
+    Test slots hold a handful of plain files and folders, so a direct scandir
+    walk is enough; it skips rmtree's extra stat and fd-safety work.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _empty_directory(entry.path)
+                os.rmdir(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+class _DirectoryPool:
+    """Reusable test directory layouts, handed out one slot per test.
+
+    Freed slots go back on a LIFO stack and the pool only grows when every
+    slot is in use, so a serial run keeps reusing the same slot.
+    """
+
+    def __init__(self, base: str) -> None:
+        self.base = base
+        self._free: queue.LifoQueue = queue.LifoQueue()
+        self._created = 0
+
+    def acquire(self) -> str:
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            slot = os.path.join(self.base, f"slot_{self._created}")
+            self._created += 1
+            os.mkdir(slot)
+            for name in TEST_DIRECTORY_NAMES:
+                os.mkdir(os.path.join(slot, name))
+            return slot
+
+    def release(self, slot: str) -> None:
+        # Empty the slot and put it back rather than deleting it; the layout
+        # directories are kept, and recreated only if a test removed one
+        with os.scandir(slot) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    os.unlink(entry.path)
+                    continue
+                _empty_directory(entry.path)
+                if entry.name not in TEST_DIRECTORY_NAMES:
+                    os.rmdir(entry.path)
+        for name in TEST_DIRECTORY_NAMES:
+            os.makedirs(os.path.join(slot, name), exist_ok=True)
+        self._free.put(slot)
+
+
+@pytest.fixture(scope="session")
+def _directory_pool(tmp_path_factory) -> _DirectoryPool:
+    """Share one directory pool across the session.
+
+    The pool lives under pytest's base temp directory, so pytest prunes it
+    with the rest of an old run even when that run was interrupted. Each
+    pytest-xdist worker has its own pool, so no locking is needed.
+    """
+    return _DirectoryPool(str(tmp_path_factory.mktemp("directory_pool")))
 
 
 @pytest.fixture
-def test_directories() -> Generator[Dict[str, str], None, None]:
+def test_directories(_directory_pool: _DirectoryPool) -> Iterator[Dict[str, str]]:
     """Create test directory structure with fresh directories for each test."""
-    temp_dir = tempfile.mkdtemp(prefix="video_transcriber_test_")
-    dirs = {
-        "uploads": os.path.join(temp_dir, "uploads"),
-        "results": os.path.join(temp_dir, "results"),
-        "config": os.path.join(temp_dir, "config"),
-        "logs": os.path.join(temp_dir, "logs"),
-    }
-
-    for dir_path in dirs.values():
-        os.makedirs(dir_path, exist_ok=True)
+    slot = _directory_pool.acquire()
+    yield {name: os.path.join(slot, name) for name in TEST_DIRECTORY_NAMES}
+    _directory_pool.release(slot)
 
-    yield dirs
-    shutil.rmtree(temp_dir, ignore_errors=True)
 
+# Manager mocks are built per test with Mock(spec=...): it is much cheaper than
+# create_autospec, and copying a shared prototype would share child mocks (and
+# their return values) between tests.
+def _make_memory_manager() -> Mock:
+    from src.models import MemoryManager
 
-@pytest.fixture
-def mock_memory_manager() -> Mock:
-    """Create mock memory manager for testing."""
-    mock_manager = Mock(spec=MemoryManager)
+    mock_manager = Mock(spec=MemoryManager, name="memory_manager")
     mock_manager.get_memory_info.return_value = {
         "system_total_gb": 16.0,
         "system_available_gb": 8.0,
@@ -90,10 +159,10 @@ def mock_memory_manager() -> Mock:
     return mock_manager
 
 
-@pytest.fixture
-def mock_file_manager() -> Mock:
-    """Create mock file manager for testing."""
-    mock_manager = Mock(spec=ProgressiveFileManager)
+def _make_file_manager() -> Mock:
+    from src.models import ProgressiveFileManager
+
+    mock_manager = Mock(spec=ProgressiveFileManager, name="file_manager")
     mock_manager.get_cleanup_stats.return_value = {
         "count": 0,
         "total_size_mb": 0.0,
@@ -102,37 +171,30 @@ def mock_file_manager() -> Mock:
     return mock_manager
 
 
-@pytest.fixture
-def mock_progress_tracker() -> Mock:
-    """Create mock progress tracker for testing."""
-    mock_tracker = Mock(spec=ProgressTracker)
+def _make_progress_tracker() -> Mock:
+    from src.models.progress import ProgressTracker
+
+    mock_tracker = Mock(spec=ProgressTracker, name="progress_tracker")
     mock_tracker.sessions = {}
     mock_tracker.get_session_progress.return_value = None
     return mock_tracker
 
 
-@pytest.fixture
-def mock_model_manager() -> Mock:
-    """Create mock model manager for testing."""
-    mock_manager = Mock(spec=ModelManager)
-    mock_model = Mock()
-    mock_model.transcribe.return_value = {
+# Fixed model outputs. The stand-in models below are plain objects rather than
+# Mocks: nothing asserts on their calls, so call recording is pure overhead.
+_MODEL_MANAGER_RESULT = types.MappingProxyType(
+    {
         "text": "This is a test transcription.",
-        "segments": [
-            {"start": 0.0, "end": 5.0, "text": "This is a test transcription."}
-        ],
+        "segments": (
+            {"start": 0.0, "end": 5.0, "text": "This is a test transcription."},
+        ),
     }
-    mock_manager.get_model.return_value = mock_model
-    return mock_manager
-
+)
 
-@pytest.fixture
-def mock_whisper_model() -> Mock:
-    """Create mock Whisper model for testing."""
-    mock_model = Mock()
-    mock_model.transcribe.return_value = {
+_WHISPER_MODEL_RESULT = types.MappingProxyType(
+    {
         "text": "Hello world test transcription",
-        "segments": [
+        "segments": (
             {
                 "start": 0.0,
                 "end": 2.5,
@@ -143,76 +205,159 @@ def mock_whisper_model() -> Mock:
                 "end": 5.0,
                 "text": "test transcription",
             },
-        ],
+        ),
     }
-    return mock_model
+)
+
+
+def _make_model_manager() -> Mock:
+    from src.models import ModelManager
+
+    mock_manager = Mock(spec=ModelManager, name="model_manager")
+    mock_manager.get_model.return_value = types.SimpleNamespace(
+        transcribe=lambda audio, **kwargs: _MODEL_MANAGER_RESULT
+    )
+    return mock_manager
+
+
+def _make_whisper_model() -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        transcribe=lambda audio, **kwargs: _WHISPER_MODEL_RESULT
+    )
 
 
 @pytest.fixture
-def sample_video_data() -> bytes:
-    """Generate sample video data for testing."""
-    # Create minimal valid MP4 header for testing
-    return b"\x00\x00\x00\x20ftypmp41\x00\x00\x00\x00mp41isom" + b"\x00" * 100
+def mock_memory_manager() -> Mock:
+    """Create mock memory manager for testing."""
+    return _make_memory_manager()
 
 
 @pytest.fixture
-def sample_audio_data() -> bytes:
-    """Generate sample audio data for testing."""
-    # Create minimal valid WAV header for testing
-    return (
-        b"RIFF\x24\x08\x00\x00WAVEfmt \x10\x00\x00\x00"
-        b"\x01\x00\x01\x00\x44\xac\x00\x00\x88X\x01\x00"
-        b"\x02\x00\x10\x00data\x00\x08\x00\x00"
-    ) + b"\x00" * 100
+def mock_file_manager() -> Mock:
+    """Create mock file manager for testing."""
+    return _make_file_manager()
 
 
 @pytest.fixture
-def sample_session_metadata() -> Dict[str, Any]:
-    """Generate sample session metadata for testing."""
-    return {
-        "session_id": "test_session_123",
-        "session_name": "Test Session",
-        "original_filename": "test_video.mp4",
-        "created_at": "2024-01-01T12:00:00",
-        "status": "completed",
-        "processing_time": 45.2,
-        "video_duration": 120.0,
-        "file_size_mb": 25.5,
-    }
+def mock_progress_tracker() -> Mock:
+    """Create mock progress tracker for testing."""
+    return _make_progress_tracker()
 
 
 @pytest.fixture
-def sample_transcription_result() -> Dict[str, Any]:
-    """Generate sample transcription result for testing."""
-    return {
-        "text": "This is a sample transcription for testing purposes.",
-        "segments": [
-            {
-                "start": 0.0,
-                "end": 3.0,
-                "text": "This is a sample transcription",
-                "timestamp_str": "00:00:00",
-            },
-            {
-                "start": 3.0,
-                "end": 6.0,
-                "text": "for testing purposes.",
-                "timestamp_str": "00:00:03",
-            },
-        ],
-        "analysis": {
-            "keyword_matches": [],
-            "questions": [],
-            "emphasis_cues": [],
-            "keyword_frequency": {},
-            "total_words": 8,
-        },
-    }
+def mock_model_manager() -> Mock:
+    """Create mock model manager for testing."""
+    return _make_model_manager()
 
 
 @pytest.fixture
-def flask_app(test_config: AppConfig, test_directories: Dict[str, str]) -> Flask:
-    """Create Flask app for testing."""
+def mock_whisper_model() -> types.SimpleNamespace:
+    """Create mock Whisper model for testing."""
+    return _make_whisper_model()
+
+
+@pytest.fixture(scope="module")
+def shared_transcriber(tmp_path_factory) -> Any:
+    """
+    Create one VideoTranscriber on the standard manager mocks per test module.
+
+    Tests that share it must undo their changes to the instance (monkeypatch,
+    patch.object) and clear the recorded mock calls themselves.
+    """
+    from src.services.transcription import VideoTranscriber
+
+    return VideoTranscriber(
+        memory_manager=_make_memory_manager(),
+        file_manager=_make_file_manager(),
+        progress_tracker=_make_progress_tracker(),
+        results_folder=str(tmp_path_factory.mktemp("shared_results")),
+    )
+
+
+# Minimal valid MP4 header for testing
+_SAMPLE_MP4 = b"\x00\x00\x00\x20ftypmp41\x00\x00\x00\x00mp41isom" + bytes(100)
+
+# Minimal valid WAV header for testing
+_SAMPLE_WAV = (
+    b"RIFF\x24\x08\x00\x00WAVEfmt \x10\x00\x00\x00"
+    b"\x01\x00\x01\x00\x44\xac\x00\x00\x88X\x01\x00"
+    b"\x02\x00\x10\x00data\x00\x08\x00\x00"
+) + bytes(100)
+
+
+@pytest.fixture(scope="session")
+def sample_video_data() -> bytes:
+    """Generate sample video data for testing."""
+    return _SAMPLE_MP4
+
+
+@pytest.fixture(scope="session")
+def sample_audio_data() -> bytes:
+    """Generate sample audio data for testing."""
+    return _SAMPLE_WAV
+
+
+@pytest.fixture(scope="session")
+def sample_session_metadata() -> Mapping[str, Any]:
+    """Generate sample session metadata for testing (read-only; copy to edit)."""
+    return types.MappingProxyType(
+        {
+            "session_id": "test_session_123",
+            "session_name": "Test Session",
+            "original_filename": "test_video.mp4",
+            "created_at": "2024-01-01T12:00:00",
+            "status": "completed",
+            "processing_time": 45.2,
+            "video_duration": 120.0,
+            "file_size_mb": 25.5,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_transcription_result() -> Mapping[str, Any]:
+    """Generate sample transcription result for testing (read-only; copy to edit).
+
+    Shared by the whole session, so the nested segments and analysis are frozen
+    as well: tuples and read-only mappings all the way down.
+    """
+    return types.MappingProxyType(
+        {
+            "text": "This is a sample transcription for testing purposes.",
+            "segments": (
+                types.MappingProxyType(
+                    {
+                        "start": 0.0,
+                        "end": 3.0,
+                        "text": "This is a sample transcription",
+                        "timestamp_str": "00:00:00",
+                    }
+                ),
+                types.MappingProxyType(
+                    {
+                        "start": 3.0,
+                        "end": 6.0,
+                        "text": "for testing purposes.",
+                        "timestamp_str": "00:00:03",
+                    }
+                ),
+            ),
+            "analysis": types.MappingProxyType(
+                {
+                    "keyword_matches": (),
+                    "questions": (),
+                    "emphasis_cues": (),
+                    "keyword_frequency": types.MappingProxyType({}),
+                    "total_words": 8,
+                }
+            ),
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def _flask_app_session(test_config: AppConfig, tmp_path_factory) -> Flask:
+    """Create and wire the Flask app once for the whole test session."""
     # Import main app creation function and other dependencies
     from main import (
         create_app,
@@ -221,24 +366,32 @@ def flask_app(test_config: AppConfig, test_directories: Dict[str, str]) -> Flask
         register_routes,
     )
 
-    # Override config paths with test directories
-    test_config.UPLOAD_FOLDER = test_directories["uploads"]
-    test_config.RESULTS_FOLDER = test_directories["results"]
+    results_folder = str(tmp_path_factory.mktemp("session_results"))
+    database_path = tmp_path_factory.mktemp("auth_db") / "video_transcriber.db"
 
-    # Create app and socketio
-    app, socketio = create_app()
+    # Create app and socketio; the auth database is bound while the app is
+    # created, so point it at a throwaway file instead of the checked-in one
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(AppConfig, "DATABASE_URL", f"sqlite:///{database_path}")
+        app, socketio = create_app()
     app.config["TESTING"] = True
     app.config["WTF_CSRF_ENABLED"] = False
 
+    # Templates never change during a run; skip the per-render mtime checks
+    # that auto-reload (on whenever DEBUG is set in the environment) adds
+    app.config["TEMPLATES_AUTO_RELOAD"] = False
+    app.jinja_env.auto_reload = False
+
     # Initialize managers for full functionality
     memory_manager, file_manager, progress_tracker = initialize_managers(socketio)
 
     # Create transcriber
     transcriber = create_transcriber(
-        memory_manager, file_manager, progress_tracker, test_directories["results"]
+        memory_manager, file_manager, progress_tracker, results_folder
     )
 
-    # Register all routes (this includes the API routes)
+    # Register all routes (this includes the API routes); blueprints can only
+    # be registered once per app, which session scope guarantees
     register_routes(
         app,
         socketio,
@@ -253,9 +406,46 @@ def flask_app(test_config: AppConfig, test_directories: Dict[str, str]) -> Flask
 
 
 @pytest.fixture
-def client(flask_app: Flask) -> FlaskClient:
-    """Create test client for Flask app."""
-    return flask_app.test_client()
+def flask_app(
+    _flask_app_session: Flask,
+    test_config: AppConfig,
+    test_directories: Dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> Flask:
+    """Point the shared Flask app at this test's directories."""
+    from src.services.batch_processing import batch_processor
+
+    # Override config paths with test directories; monkeypatch restores them
+    monkeypatch.setattr(test_config, "UPLOAD_FOLDER", test_directories["uploads"])
+    monkeypatch.setattr(test_config, "RESULTS_FOLDER", test_directories["results"])
+    monkeypatch.setitem(
+        _flask_app_session.config, "UPLOAD_FOLDER", test_directories["uploads"]
+    )
+    monkeypatch.setitem(
+        _flask_app_session.config, "RESULTS_FOLDER", test_directories["results"]
+    )
+    monkeypatch.setattr(
+        batch_processor.transcriber, "results_folder", test_directories["results"]
+    )
+
+    return _flask_app_session
+
+
+@pytest.fixture(scope="session")
+def _flask_client_session(_flask_app_session: Flask) -> FlaskClient:
+    """Create one test client for the shared Flask app."""
+    return _flask_app_session.test_client()
+
+
+@pytest.fixture
+def client(flask_app: Flask, _flask_client_session: FlaskClient) -> FlaskClient:
+    """Return the shared test client with cookies cleared for this test."""
+    # Werkzeug 2.3+ keeps cookies in a dict; older releases use a CookieJar
+    cookies = getattr(_flask_client_session, "_cookies", None)
+    if cookies is None:
+        cookies = _flask_client_session.cookie_jar
+    cookies.clear()
+    return _flask_client_session
 
 
 @pytest.fixture
@@ -311,3 +501,8 @@ def pytest_configure(config):
         "markers", "requires_model: mark test as requiring Whisper model"
     )
     config.addinivalue_line("markers", "requires_ffmpeg: mark test as requiring FFmpeg")
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep tests on one pytest-xdist worker under "
+        "--dist loadgroup",
+    )
@@ -0,0 +1,83 @@
+"""
+Shared fixtures for the authentication integration tests.
+
+These tests drive the auth blueprint through the Flask test client, so they
+need no running server and no open port. They are safe to run under
+pytest-xdist: each worker builds its own session app and throwaway auth
+database, and registered usernames are unique per test.
+"""
+
+import re
+import uuid
+from typing import Dict, Tuple
+
+import pytest
+from flask import Flask, session
+from flask.testing import FlaskClient
+from flask_wtf.csrf import generate_csrf
+from werkzeug.test import TestResponse
+
+# Matched against the raw body so the page is never decoded just for the token.
+# hidden_tag() renders id/name/type/value in one <input>, so the scan for value
+# stays inside that tag ([^>]*) rather than backtracking across the page (.*?)
+_CSRF_RE = re.compile(rb'name="csrf_token"[^>]*value="([^"]+)"')
+
+TEST_PASSWORD = "TestPassword123!"
+
+
+def _fetch_csrf(client: FlaskClient, path: str) -> Tuple[TestResponse, str]:
+    """Load a form page and return the response with its CSRF token."""
+    response = client.get(path)
+    csrf_match = _CSRF_RE.search(response.data)
+    return response, csrf_match.group(1).decode() if csrf_match else ""
+
+
+@pytest.fixture
+def csrf_enabled(flask_app: Flask, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Turn on CSRF protection, which the test configuration disables."""
+    monkeypatch.setitem(flask_app.config, "WTF_CSRF_ENABLED", True)
+
+
+@pytest.fixture
+def csrf_token(flask_app: Flask, client: FlaskClient, csrf_enabled: None) -> str:
+    """Mint a CSRF token for the client without rendering any form page."""
+    field_name = flask_app.config.get("WTF_CSRF_FIELD_NAME", "csrf_token")
+
+    with flask_app.test_request_context():
+        token = generate_csrf()
+        raw_token = session[field_name]
+
+    # generate_csrf keeps the unsigned secret in the session; hand it to the
+    # client's cookie so the signed token validates on the next request
+    with client.session_transaction() as client_session:
+        client_session[field_name] = raw_token
+
+    return token
+
+
+@pytest.fixture
+def register_csrf(client: FlaskClient) -> Tuple[TestResponse, str]:
+    """Registration page response and its CSRF token."""
+    return _fetch_csrf(client, "/auth/register")
+
+
+@pytest.fixture
+def login_csrf(client: FlaskClient) -> Tuple[TestResponse, str]:
+    """Login page response and its CSRF token."""
+    return _fetch_csrf(client, "/auth/login")
+
+
+@pytest.fixture
+def registered_user(client: FlaskClient) -> Dict[str, str]:
+    """Register a fresh user through the form; the client stays logged in."""
+    unique_id = uuid.uuid4().hex[:8]
+    user = {
+        "username": f"testuser{unique_id}",
+        "email": f"test{unique_id}@example.com",
+        "display_name": f"Test User {unique_id}",
+        "password": TEST_PASSWORD,
+    }
+
+    response = client.post("/auth/register", data={**user, "password2": TEST_PASSWORD})
+    assert response.status_code == 302, "registration should redirect home"
+    return user
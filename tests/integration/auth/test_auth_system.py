@@ -1,118 +1,51 @@
 #!/usr/bin/env python3
 """
-Quick test script for authentication functionality.
+Quick tests for authentication functionality.
 
-This script tests the authentication system by simulating form submissions
-and checking that CSRF protection and user registration work correctly.
+These tests check that the authentication pages render with CSRF protection,
+that the main application still works alongside them, and that form
+validation rejects empty submissions.
 """
 
-import sys
-from urllib.parse import urljoin
-
-import requests
-
-
-def test_auth_forms(base_url="http://localhost:5001"):
-    """Test authentication forms for CSRF token presence and form submission."""
-    print("🔐 Testing Video Transcriber Authentication System")
-    print("=" * 60)
-
-    session = requests.Session()
-
-    # Test 1: Check registration page loads
-    print("1️⃣  Testing registration page...")
-    try:
-        response = session.get(urljoin(base_url, "/auth/register"))
-        if response.status_code == 200:
-            if "csrf_token" in response.text:
-                print("   ✅ Registration page loads with CSRF token")
-            else:
-                print("   ⚠️  Registration page loads but no CSRF token found")
-        else:
-            print(f"   ❌ Registration page failed: {response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Registration page error: {e}")
-
-    # Test 2: Check login page loads
-    print("2️⃣  Testing login page...")
-    try:
-        response = session.get(urljoin(base_url, "/auth/login"))
-        if response.status_code == 200:
-            if "csrf_token" in response.text:
-                print("   ✅ Login page loads with CSRF token")
-            else:
-                print("   ⚠️  Login page loads but no CSRF token found")
-        else:
-            print(f"   ❌ Login page failed: {response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Login page error: {e}")
-
-    # Test 3: Check main application still works
-    print("3️⃣  Testing main application...")
-    try:
-        response = session.get(base_url)
-        if response.status_code == 200:
-            print("   ✅ Main application accessible")
-            if "Sign In" in response.text or "Sign Up" in response.text:
-                print("   ✅ Authentication links present in navigation")
-            else:
-                print("   ⚠️  Authentication links not found in navigation")
-        else:
-            print(f"   ❌ Main application failed: {response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Main application error: {e}")
-
-    # Test 4: Test form validation (without actual submission)
-    print("4️⃣  Testing form protection...")
-    try:
-        # Get registration form
-        response = session.get(urljoin(base_url, "/auth/register"))
-        if response.status_code == 200:
-            # Try to submit empty form (should trigger validation)
-            form_data = {
-                "username": "",
-                "email": "",
-                "password": "",
-                "confirm_password": "",
-            }
-            response = session.post(urljoin(base_url, "/auth/register"), data=form_data)
-
-            if response.status_code == 200:
-                if (
-                    "token expired" in response.text.lower()
-                    or "csrf" in response.text.lower()
-                ):
-                    print("   ✅ CSRF protection active")
-                elif (
-                    "required" in response.text.lower()
-                    or "field is required" in response.text.lower()
-                ):
-                    print("   ✅ Form validation working")
-                else:
-                    print("   ✅ Form protection active (no errors shown)")
-            else:
-                print(f"   ⚠️  Unexpected response: {response.status_code}")
-        else:
-            print("   ❌ Could not test form protection")
-    except Exception as e:
-        print(f"   ❌ Form protection test error: {e}")
-
-    print("\n🎯 Authentication System Status:")
-    print("   • CSRF Protection: ✅ Enabled")
-    print("   • Form Validation: ✅ Active")
-    print("   • Authentication Routes: ✅ Working")
-    print("   • Main App Integration: ✅ Compatible")
-    print("\n✨ Authentication system is ready for use!")
-    print("   📝 Create account: http://localhost:5001/auth/register")
-    print("   🔑 Sign in: http://localhost:5001/auth/login")
+import pytest
+
+
+def test_registration_page_has_csrf_token(csrf_enabled, register_csrf):
+    """Registration page loads with a CSRF token."""
+    response, csrf_token = register_csrf
+
+    assert response.status_code == 200
+    assert csrf_token
+
+
+def test_login_page_has_csrf_token(csrf_enabled, login_csrf):
+    """Login page loads with a CSRF token."""
+    response, csrf_token = login_csrf
+
+    assert response.status_code == 200
+    assert csrf_token
+
+
+def test_main_application_accessible(client):
+    """Main application still serves its index page."""
+    response = client.get("/")
+
+    assert response.status_code == 200
+
+
+def test_empty_registration_is_rejected(client):
+    """Submitting an empty registration form shows validation errors."""
+    form_data = {
+        "username": "",
+        "email": "",
+        "password": "",
+        "password2": "",
+    }
+    response = client.post("/auth/register", data=form_data)
+
+    assert response.status_code == 200
+    assert "required" in response.get_data(as_text=True).lower()
 
 
 if __name__ == "__main__":
-    try:
-        test_auth_forms()
-    except KeyboardInterrupt:
-        print("\n\n🛑 Test interrupted by user")
-        sys.exit(0)
-    except Exception as e:
-        print(f"\n\n❌ Test failed with error: {e}")
-        sys.exit(1)
+    raise SystemExit(pytest.main([__file__, "-s"]))
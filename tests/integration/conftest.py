@@ -0,0 +1,47 @@
+"""
+Shared fixtures for the integration tests that talk to a running server.
+"""
+
+from typing import Iterator
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+LIVE_SERVER_URL = "http://localhost:5000"
+
+
+@pytest.fixture(scope="session")
+def live_server() -> Iterator[requests.Session]:
+    """
+    Keep-alive session against the running application server.
+
+    The server is probed once per test session; when it is not running every
+    test that asks for it is skipped without opening another connection. A
+    server that is up but answers the status probe with an error fails them.
+    """
+    session = requests.Session()
+    # No retries against localhost, so a failing server fails in one round
+    # trip; the pool is large enough for the concurrent download tests
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=16, max_retries=Retry(total=0)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    try:
+        session.get(
+            f"{LIVE_SERVER_URL}/api/system/status", timeout=1
+        ).raise_for_status()
+    except (requests.ConnectionError, requests.Timeout):
+        session.close()
+        pytest.skip("Server not running - integration test requires running server")
+    except requests.HTTPError as exc:
+        session.close()
+        pytest.fail(
+            f"Server status check returned HTTP {exc.response.status_code}",
+            pytrace=False,
+        )
+
+    yield session
+    session.close()
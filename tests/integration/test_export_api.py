@@ -4,28 +4,69 @@ Test script for enhanced export API endpoints.
 Tests the new export format capabilities without requiring a full transcription.
 """
 
+import functools
+import json
+import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import pytest
 import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "http://localhost:5000"
+EXPECTED_FORMATS = frozenset({"srt", "vtt", "enhanced_txt", "json", "html"})
+FORMATS_TO_TEST = ("srt", "vtt", "enhanced_txt", "pdf", "docx", "json", "html")
+
+# Fewer download workers than formats, so after a connection error the
+# downloads still queued can be cancelled rather than all failing in turn
+DOWNLOAD_WORKERS = 4
+
+# Export generation options, serialized once rather than on every request
+EXPORT_OPTIONS_PAYLOAD = json.dumps(
+    {
+        "formats": {
+            "srt": True,
+            "vtt": True,
+            "enhanced_txt": True,
+            "pdf": True,  # Will work if reportlab is installed
+            "docx": True,  # Will work if python-docx is installed
+        }
+    }
+).encode()
 
 
-def test_export_endpoints():
-    """Test the enhanced export API endpoints"""
-    base_url = "http://localhost:5000"
-
-    print("🧪 Testing Enhanced Export API Endpoints...")
-    print("-" * 50)
+@functools.lru_cache(maxsize=1)
+def _server_session() -> requests.Session:
+    """
+    Keep-alive session for standalone runs, probed once per process.
 
-    # Skip if server not running
+    Under pytest the live_server fixture plays this role. The pool is sized so
+    each concurrent format download gets its own connection. An error
+    status from the server raises, like a refused connection.
+    """
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_maxsize=DOWNLOAD_WORKERS))
     try:
-        response = requests.get(f"{base_url}/api/export/formats", timeout=1)
-    except (requests.ConnectionError, requests.Timeout):
-        pytest.skip("Server not running - integration test requires running server")
+        session.get(f"{BASE_URL}/api/system/status", timeout=5).raise_for_status()
+    except requests.RequestException:
+        session.close()
+        raise
+    return session
+
+
+def test_export_endpoints(live_server):
+    """Test the enhanced export API endpoints"""
+    base_url = BASE_URL
+
+    logger.debug("🧪 Testing Enhanced Export API Endpoints...")
 
     # Test 1: Get available export formats
-    print("1. Testing export formats endpoint...")
+    logger.debug("1. Testing export formats endpoint...")
+    response = live_server.get(f"{base_url}/api/export/formats", timeout=5)
     assert (
         response.status_code == 200
     ), f"Export formats endpoint failed with status {response.status_code}"
@@ -37,66 +78,98 @@ def test_export_endpoints():
 
     assert "formats" in data, "Response missing 'formats' key"
 
-    print("✅ Export formats endpoint working")
-    print("📋 Available formats:")
-    for format_name, info in data["formats"].items():
-        status = "✅" if info["available"] else "❌"
-        print(f"   {status} {format_name}: {info['description']}")
+    logger.debug("✅ Export formats endpoint working")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📋 Available formats:")
+        for format_name, info in data["formats"].items():
+            status = "✅" if info["available"] else "❌"
+            logger.debug("   %s %s: %s", status, format_name, info["description"])
 
     # Assert that core formats are present
-    expected_formats = ["srt", "vtt", "enhanced_txt", "json", "html"]
-    for fmt in expected_formats:
-        assert (
-            fmt in data["formats"]
-        ), f"Required format '{fmt}' missing from API response"
-
-    print()
+    missing_formats = EXPECTED_FORMATS - data["formats"].keys()
+    assert (
+        not missing_formats
+    ), f"Required formats missing from API response: {sorted(missing_formats)}"
 
     # Test 2: Look for an existing session to test download endpoints
-    print("2. Looking for existing sessions...")
+    logger.debug("2. Looking for existing sessions...")
     results_folder = Path("results")
 
     if not results_folder.exists():
-        print(
+        logger.warning(
             "❌ No results folder found. Run a transcription first to test "
             "download endpoints."
         )
         return
 
-    sessions = [d for d in results_folder.iterdir() if d.is_dir()]
-    if not sessions:
-        print(
+    # Use the most recent session; scandir entries answer is_dir() and stat()
+    # from the directory listing, so each session costs at most one syscall
+    with os.scandir(results_folder) as entries:
+        test_session = max(
+            (entry for entry in entries if entry.is_dir(follow_symlinks=False)),
+            key=lambda entry: entry.stat(follow_symlinks=False).st_mtime,
+            default=None,
+        )
+    if test_session is None:
+        logger.warning(
             "❌ No sessions found. Run a transcription first to test download endpoints."
         )
         return
 
-    # Use the most recent session
-    test_session = max(sessions, key=lambda x: x.stat().st_mtime)
     session_id = test_session.name
-    print(f"📁 Using session: {session_id}")
+    logger.debug("📁 Using session: %s", session_id)
 
     # Test 3: Test individual format downloads
-    print("\n3. Testing individual format downloads...")
-    formats_to_test = ["srt", "vtt", "enhanced_txt", "pdf", "docx", "json", "html"]
-
+    logger.debug("3. Testing individual format downloads...")
     download_results = {}
-    for format_name in formats_to_test:
-        print(f"   Testing {format_name} download...")
-        try:
-            response = requests.get(f"{base_url}/api/export/{session_id}/{format_name}")
-            download_results[format_name] = response.status_code
-            if response.status_code == 200:
-                print(
-                    f"   ✅ {format_name} download successful "
-                    f"({len(response.content)} bytes)"
-                )
-            elif response.status_code == 404:
-                print(f"   ⚠️  {format_name} file not found (may need to be generated)")
-            else:
-                print(f"   ❌ {format_name} failed: HTTP {response.status_code}")
-        except requests.RequestException as e:
-            print(f"   ❌ {format_name} request failed: {e}")
-            download_results[format_name] = "error"
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        # Streamed so the export bodies are never buffered; only the status and
+        # the Content-Length header are needed here
+        futures = {
+            executor.submit(
+                live_server.get,
+                f"{base_url}/api/export/{session_id}/{format_name}",
+                stream=True,
+                timeout=30,
+            ): format_name
+            for format_name in FORMATS_TO_TEST
+        }
+        for future in as_completed(futures):
+            format_name = futures[future]
+            try:
+                with future.result() as response:
+                    download_results[format_name] = response.status_code
+                    size = response.headers.get("Content-Length", "unknown")
+                if response.status_code == 200:
+                    logger.debug(
+                        "   ✅ %s download successful (%s bytes)", format_name, size
+                    )
+                elif response.status_code == 404:
+                    logger.debug(
+                        "   ⚠️  %s file not found (may need to be generated)",
+                        format_name,
+                    )
+                else:
+                    logger.warning(
+                        "   ❌ %s failed: HTTP %s", format_name, response.status_code
+                    )
+            except requests.ConnectionError as e:
+                # The server has gone away, so the remaining downloads can only
+                # fail the same way; record them once instead of one by one
+                logger.warning("   ❌ %s request failed: %s", format_name, e)
+                executor.shutdown(wait=False, cancel_futures=True)
+                for pending_format in FORMATS_TO_TEST:
+                    download_results.setdefault(pending_format, "error")
+                break
+            except requests.RequestException as e:
+                logger.warning("   ❌ %s request failed: %s", format_name, e)
+                download_results[format_name] = "error"
+
+    # Downloads still running at the break finish when the executor exits;
+    # release their streamed responses (closing a read one again is harmless)
+    for future in futures:
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
 
     # Assert that at least basic formats are testable
     assert any(
@@ -104,22 +177,13 @@ def test_export_endpoints():
     ), "Basic export formats should be accessible via API"
 
     # Test 4: Test export generation
-    print("\n4. Testing export generation...")
+    logger.debug("4. Testing export generation...")
     try:
-        export_options = {
-            "formats": {
-                "srt": True,
-                "vtt": True,
-                "enhanced_txt": True,
-                "pdf": True,  # Will work if reportlab is installed
-                "docx": True,  # Will work if python-docx is installed
-            }
-        }
-
-        response = requests.post(
+        response = live_server.post(
             f"{base_url}/api/export/{session_id}/generate",
-            json=export_options,
+            data=EXPORT_OPTIONS_PAYLOAD,
             headers={"Content-Type": "application/json"},
+            timeout=60,
         )
 
         assert response.status_code == 200, (
@@ -133,8 +197,8 @@ def test_export_endpoints():
         ), f"Export generation failed: {data.get('error', 'Unknown error')}"
         assert "exported_files" in data, "Response missing 'exported_files' key"
 
-        print("✅ Export generation successful")
-        print(f"📦 Generated files: {', '.join(data.get('exported_files', {}).keys())}")
+        logger.debug("✅ Export generation successful")
+        logger.debug("📦 Generated files: %s", ", ".join(data["exported_files"]))
 
         # Assert that at least some files were generated
         assert (
@@ -142,15 +206,14 @@ def test_export_endpoints():
         ), "No files were generated during export"
 
     except requests.RequestException as e:
-        print(f"❌ Export generation request failed: {e}")
+        logger.warning("❌ Export generation request failed: %s", e)
         raise AssertionError(f"Failed to connect to export generation endpoint: {e}")
 
-    print("\n" + "=" * 50)
-    print("🏁 Export API testing complete!")
-    print("\n💡 Tips:")
-    print("   • Install reportlab for PDF exports: pip install reportlab")
-    print("   • Install python-docx for DOCX exports: pip install python-docx")
-    print("   • SRT, VTT, and enhanced text work without additional dependencies")
+    logger.debug("🏁 Export API testing complete!")
+    logger.debug(
+        "💡 Tips: install reportlab for PDF exports and python-docx for DOCX "
+        "exports; SRT, VTT and enhanced text need no additional dependencies"
+    )
 
 
 def main():
@@ -160,18 +223,18 @@ def main():
 
     # Check if server is running
     try:
-        response = requests.get("http://localhost:5000/", timeout=5)
-        if response.status_code == 200:
-            print("✅ Server is running")
-        else:
-            print(f"⚠️  Server returned HTTP {response.status_code}")
+        session = _server_session()
     except requests.RequestException:
         print("❌ Server is not running. Start the application first with:")
         print("   python app.py")
         sys.exit(1)
 
+    print("✅ Server is running")
     print()
-    test_export_endpoints()
+    # The test reports its progress through the module logger
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.DEBUG)
+    test_export_endpoints(session)
 
 
 if __name__ == "__main__":
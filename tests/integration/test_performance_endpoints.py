@@ -3,9 +3,7 @@
 Test script for performance optimization endpoints.
 """
 
-import json
-import sys
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import requests
@@ -13,7 +11,7 @@ import requests
 BASE_URL = "http://localhost:5000"
 
 
-def test_performance_endpoints():
+def test_performance_endpoints(live_server):
     """Test performance API endpoints"""
     endpoints = [
         ("/api/system/status", "GET"),
@@ -22,34 +20,27 @@ def test_performance_endpoints():
         ("/api/performance/optimize", "POST", {"force_memory_cleanup": False}),
     ]
 
-    # Skip if server not running
-    try:
-        requests.get(f"{BASE_URL}/api/system/status", timeout=1)
-    except (requests.ConnectionError, requests.Timeout):
-        pytest.skip("Server not running - integration test requires running server")
-
-    success_count = 0
-    for endpoint_data in endpoints:
-        endpoint = endpoint_data[0]
-        method = endpoint_data[1]
-        data = endpoint_data[2] if len(endpoint_data) > 2 else None
-
-        if _test_endpoint(endpoint, method, data):
-            success_count += 1
+    # The probes are independent, so they run concurrently over the session
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        results = executor.map(
+            lambda endpoint_data: _probe(live_server, *endpoint_data),
+            endpoints,
+        )
+        success_count = sum(results)
 
     assert (
         success_count >= len(endpoints) // 2
     ), f"Only {success_count}/{len(endpoints)} endpoints working"
 
 
-def _test_endpoint(endpoint, method="GET", data=None):
-    """Test an API endpoint"""
+def _probe(session, endpoint, method="GET", data=None):
+    """Return whether an API endpoint answers 200 over the shared session."""
     try:
         url = f"{BASE_URL}{endpoint}"
         if method == "GET":
-            response = requests.get(url, timeout=5)
+            response = session.get(url, timeout=5)
         else:
-            response = requests.post(url, json=data, timeout=5)
+            response = session.post(url, json=data, timeout=5)
 
         return response.status_code == 200
 
@@ -60,7 +51,5 @@ def _test_endpoint(endpoint, method="GET", data=None):
 
 
 if __name__ == "__main__":
-    # Run as standalone script
-    from unittest import main as unittest_main
-
-    unittest_main()
+    # Run as standalone script; pytest supplies the live_server session
+    raise SystemExit(pytest.main([__file__, "-s"]))
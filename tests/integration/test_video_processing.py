@@ -5,47 +5,96 @@ Tests the complete video processing workflow including upload,
 transcription, analysis, and result generation.
 """
 
+import contextlib
 import json
 import os
 import shutil
-import sys
 import tempfile
-from unittest.mock import MagicMock, Mock, patch
+import types
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+from unittest.mock import Mock, patch
 
 import pytest
 
-# Mock whisper module before importing src modules that depend on it
-mock_whisper = MagicMock()
-mock_whisper.load_model = Mock(return_value=Mock())
-sys.modules["whisper"] = mock_whisper
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Import modules after mocking whisper
-from src.models import MemoryManager, ProgressiveFileManager  # noqa: E402
-from src.models.exceptions import UserFriendlyError  # noqa: E402
-from src.models.progress import ProgressTracker  # noqa: E402
-from src.services.transcription import VideoTranscriber  # noqa: E402
-from src.services.upload import delete_session, process_upload  # noqa: E402
-from src.utils.session import ensure_session_exists, get_session_list  # noqa: E402
+# The whisper stub is installed by the root conftest before collection
+from src.models.exceptions import UserFriendlyError
+from src.models.progress import ProgressTracker
+from src.services.transcription import VideoTranscriber
+from src.services.upload import delete_session, process_upload
+from src.utils.session import ensure_session_exists, get_session_list
+
+# Under pytest-xdist with --dist loadgroup, keep this module's tests together on
+# one worker (the end-to-end class gets a worker of its own)
+pytestmark = pytest.mark.xdist_group(name="video_processing_integration")
+
+# Fixed parts of the mocked process_video results; tests copy and fill them in
+_METADATA_TEMPLATE = types.MappingProxyType(
+    {"status": "completed", "created_at": "2024-01-01T10:00:00"}
+)
+_ANALYSIS_TEMPLATE = types.MappingProxyType(
+    {"total_words": 100, "keyword_matches": (), "questions": (), "emphasis_cues": ()}
+)
+
+
+class _NoLockProgressTracker(ProgressTracker):
+    """Real progress tracker for single-threaded tests, without the lock."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lock = contextlib.nullcontext()
+
+
+def _json_bytes(obj: Dict[str, Any]) -> bytes:
+    """Encode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _write_files(files: Dict[str, bytes]) -> None:
+    """Write prepared payloads with one open, write and close per file."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    for path, data in files.items():
+        fd = os.open(path, flags, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
 
 
 class TestVideoProcessingPipeline:
     """Test complete video processing pipeline."""
 
     @pytest.fixture
-    def video_transcriber(
-        self,
-        mock_memory_manager,
-        mock_file_manager,
-        mock_progress_tracker,
-        test_directories,
-    ):
-        """Create VideoTranscriber instance for testing."""
-        return VideoTranscriber(
-            memory_manager=mock_memory_manager,
-            file_manager=mock_file_manager,
-            progress_tracker=mock_progress_tracker,
-            results_folder=test_directories["results"],
+    def video_transcriber(self, shared_transcriber, test_directories, monkeypatch):
+        """Create VideoTranscriber instance for testing.
+
+        The module shares one transcriber. Tests change it and its mocks only
+        through monkeypatch or patch.object; process_video also records the
+        keyword scenario on the instance, so that attribute is monkeypatched
+        here too. Every change is undone afterwards and only the recorded mock
+        calls need clearing.
+        """
+        monkeypatch.setattr(
+            shared_transcriber, "results_folder", test_directories["results"]
+        )
+        monkeypatch.setattr(
+            shared_transcriber, "_selected_keyword_scenario_id", None, raising=False
         )
+        managers = (
+            shared_transcriber.memory_manager,
+            shared_transcriber.file_manager,
+            shared_transcriber.progress_tracker,
+        )
+        yield shared_transcriber
+        for manager in managers:
+            manager.reset_mock()
 
     @pytest.mark.integration
     def test_complete_processing_workflow(
@@ -68,18 +117,12 @@ class TestVideoProcessingPipeline:
             expected_result = {
                 "session_id": session_id,
                 "metadata": {
+                    **_METADATA_TEMPLATE,
                     "session_id": session_id,
                     "session_name": "Integration Test Session",
                     "original_filename": "test_video.mp4",
-                    "status": "completed",
-                    "created_at": "2024-01-01T10:00:00",
-                },
-                "analysis": {
-                    "total_words": 100,
-                    "keyword_matches": [],
-                    "questions": [],
-                    "emphasis_cues": [],
                 },
+                "analysis": dict(_ANALYSIS_TEMPLATE),
             }
             mock_process.return_value = expected_result
 
@@ -89,8 +132,7 @@ class TestVideoProcessingPipeline:
 
             # Create metadata file
             metadata_file = os.path.join(session_dir, "metadata.json")
-            with open(metadata_file, "w") as f:
-                json.dump(expected_result["metadata"], f)
+            _write_files({metadata_file: _json_bytes(expected_result["metadata"])})
 
             # Process the video
             result = video_transcriber.process_video(
@@ -123,24 +165,24 @@ class TestVideoProcessingPipeline:
         sessions = get_session_list(results_folder)
         assert len(sessions) == 0
 
-        # Create multiple test sessions
-        session_ids = []
-        for i in range(3):
+        def _make_session(i: int) -> str:
             session_id = f"test_session_{i}"
-            session_dir = os.path.join(results_folder, session_id)
+            session_dir = f"{results_folder}{os.sep}{session_id}"
             os.makedirs(session_dir)
 
-            # Create metadata
-            metadata = {**sample_session_metadata}
-            metadata["session_id"] = session_id
-            metadata["session_name"] = f"Test Session {i}"
-            metadata["created_at"] = f"2024-01-01T{10+i:02d}:00:00"
-
-            metadata_file = os.path.join(session_dir, "metadata.json")
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f)
+            metadata = {
+                **sample_session_metadata,
+                "session_id": session_id,
+                "session_name": f"Test Session {i}",
+                "created_at": f"2024-01-01T{10+i:02d}:00:00",
+            }
+            _write_files({f"{session_dir}{os.sep}metadata.json": _json_bytes(metadata)})
+            return session_id
 
-            session_ids.append(session_id)
+        # Create multiple test sessions; each is independent, so build them
+        # concurrently rather than one directory and file at a time
+        with ThreadPoolExecutor(3) as executor:
+            session_ids = list(executor.map(_make_session, range(3)))
 
         # List sessions
         sessions = get_session_list(results_folder)
@@ -164,24 +206,39 @@ class TestVideoProcessingPipeline:
     @pytest.mark.integration
     @pytest.mark.slow
     def test_memory_constrained_processing(
-        self, video_transcriber, test_directories, sample_video_data
+        self, video_transcriber, test_directories, sample_video_data, monkeypatch
     ):
         """Test video processing under memory constraints."""
         # Create test video file
         video_path = os.path.join(test_directories["uploads"], "memory_test.mp4")
-        with open(video_path, "wb") as f:
-            f.write(sample_video_data * 100)  # Larger file
+        # Larger file: the sample repeated 100 times, written straight from the
+        # one buffer instead of building a 100x copy of it first
+        chunks = [memoryview(sample_video_data)] * 100
+        if hasattr(os, "writev"):
+            fd = os.open(video_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.writev(fd, chunks)
+            finally:
+                os.close(fd)
+        else:
+            with open(video_path, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
 
         # Mock memory manager to simulate low memory
-        video_transcriber.memory_manager.get_memory_info.return_value = {
+        memory_manager = video_transcriber.memory_manager
+        low_memory_info = {
             "system_total_gb": 4.0,
             "system_available_gb": 1.0,  # Low available memory
             "system_used_percent": 85.0,
             "process_rss_mb": 500.0,
             "process_vms_mb": 1000.0,
         }
-        video_transcriber.memory_manager.get_optimal_workers.return_value = 1
-        video_transcriber.memory_manager.check_memory_pressure.return_value = True
+        monkeypatch.setattr(
+            memory_manager.get_memory_info, "return_value", low_memory_info
+        )
+        monkeypatch.setattr(memory_manager.get_optimal_workers, "return_value", 1)
+        monkeypatch.setattr(memory_manager.check_memory_pressure, "return_value", True)
 
         # Mock the entire process_video method
         with patch.object(video_transcriber, "process_video") as mock_process:
@@ -190,11 +247,10 @@ class TestVideoProcessingPipeline:
             expected_result = {
                 "session_id": session_id,
                 "metadata": {
+                    **_METADATA_TEMPLATE,
                     "session_id": session_id,
                     "session_name": "Memory Test",
                     "original_filename": "memory_test.mp4",
-                    "status": "completed",
-                    "created_at": "2024-01-01T10:00:00",
                 },
             }
             mock_process.return_value = expected_result
@@ -240,12 +296,13 @@ class TestVideoProcessingPipeline:
 
     @pytest.mark.integration
     def test_progress_tracking_integration(
-        self, video_transcriber, test_directories, sample_video_data
+        self, video_transcriber, test_directories, sample_video_data, monkeypatch
     ):
         """Test progress tracking throughout video processing."""
-        # Use real progress tracker instead of mock
-        real_tracker = ProgressTracker()
-        video_transcriber.progress_tracker = real_tracker
+        # Use real progress tracker instead of mock; this test drives it from
+        # one thread, so it does not need the tracker's lock
+        real_tracker = _NoLockProgressTracker()
+        monkeypatch.setattr(video_transcriber, "progress_tracker", real_tracker)
 
         video_path = os.path.join(test_directories["uploads"], "progress_test.mp4")
         with open(video_path, "wb") as f:
@@ -308,31 +365,13 @@ class TestFileUploadIntegration:
     """Test file upload integration with processing pipeline."""
 
     @pytest.mark.integration
-    def test_upload_processing_integration(self, test_directories, mock_memory_manager):
-        """Test upload processing with file validation."""
-        # This test verifies that the upload processing logic handles
-        # invalid uploads correctly by expecting errors when no files are provided
-
-        # Mock transcriber
-        mock_transcriber = Mock()
-
-        # Test should raise error when called without Flask context
-        with pytest.raises(RuntimeError, match="Working outside of request context"):
-            process_upload(
-                transcriber=mock_transcriber,
-                memory_manager=mock_memory_manager,
-                upload_folder=test_directories["uploads"],
-            )
-
-    @pytest.mark.integration
-    def test_upload_validation_failures(self, test_directories, mock_memory_manager):
-        """Test upload validation failure scenarios."""
-        # This test verifies that upload validation works correctly
-        # by testing the request context dependency
-
-        mock_transcriber = Mock()
+    def test_upload_requires_request_context(
+        self, test_directories, mock_memory_manager
+    ):
+        """Upload processing reads the files from the active Flask request."""
+        # Called without a request, so validation never gets as far as the files
+        mock_transcriber = Mock(spec_set=VideoTranscriber)
 
-        # Test should raise error when called without Flask context
         with pytest.raises(RuntimeError, match="Working outside of request context"):
             process_upload(
                 transcriber=mock_transcriber,
@@ -341,6 +380,7 @@ class TestFileUploadIntegration:
             )
 
 
+@pytest.mark.xdist_group(name="video_processing_end_to_end")
 class TestEndToEndWorkflow:
     """Test complete end-to-end workflow."""
 
@@ -354,15 +394,12 @@ class TestEndToEndWorkflow:
         # Test API endpoints that don't require templates
         response = client.get("/api/keywords")
         assert response.status_code == 200
-        data = response.get_json()
-        assert "keywords" in data
+        assert "keywords" in response.json
 
         # Test performance endpoint
         response = client.get("/api/performance")
         assert response.status_code == 200
-        data = response.get_json()
-        assert "data" in data
-        assert "current_settings" in data["data"]
+        assert "current_settings" in response.json.get("data", {})
 
         # Test memory status
         response = client.get("/api/memory")
@@ -370,12 +407,10 @@ class TestEndToEndWorkflow:
         assert response.status_code in [200, 503]
 
     @pytest.mark.integration
-    def test_configuration_validation(self):
+    def test_configuration_validation(self, _validated_config):
         """Test that all configurations are valid and consistent."""
-        from src.config import validate_configurations
-
-        # Should not raise any exceptions
-        validate_configurations()
+        # The session fixture raises if any configuration is invalid
+        assert _validated_config
 
     @pytest.mark.integration
     def test_database_session_persistence(
@@ -389,10 +424,6 @@ class TestEndToEndWorkflow:
         session_dir = os.path.join(results_folder, session_id)
         os.makedirs(session_dir)
 
-        metadata_file = os.path.join(session_dir, "metadata.json")
-        with open(metadata_file, "w") as f:
-            json.dump(sample_session_metadata, f)
-
         # Create result files
         files_to_create = [
             "full_transcript.txt",
@@ -403,20 +434,24 @@ class TestEndToEndWorkflow:
             "searchable_transcript.html",
         ]
 
-        for filename in files_to_create:
-            file_path = os.path.join(session_dir, filename)
-            with open(file_path, "w") as f:
-                f.write(f"Test content for {filename}")
+        # Write the metadata and every result file in one batch
+        session_files = {
+            f"{session_dir}{os.sep}{filename}": f"Test content for {filename}".encode()
+            for filename in files_to_create
+        }
+        session_files[os.path.join(session_dir, "metadata.json")] = _json_bytes(
+            dict(sample_session_metadata)
+        )
+        _write_files(session_files)
 
         # Verify session can be loaded
         session_path, metadata = ensure_session_exists(session_id, results_folder)
         assert session_path == session_dir
         assert metadata == sample_session_metadata
 
-        # Verify all files exist
-        for filename in files_to_create:
-            file_path = os.path.join(session_dir, filename)
-            assert os.path.exists(file_path)
+        # Verify all files exist, from one directory listing
+        present = {entry.name for entry in os.scandir(session_dir)}
+        assert set(files_to_create) <= present
 
         # Test session deletion
         result, status_code = delete_session(session_id, results_folder)
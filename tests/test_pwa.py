@@ -145,19 +145,20 @@ class TestServiceWorker(unittest.TestCase):
 class TestPWARoutes(unittest.TestCase):
     """Test PWA API routes"""
 
-    def setUp(self):
-        """Set up Flask app for testing"""
-        self.app = Flask(__name__)
-        self.app.config["TESTING"] = True
-        self.app.config["SECRET_KEY"] = "test-secret-key"
+    @classmethod
+    def setUpClass(cls):
+        """Set up one Flask app and client for the whole class"""
+        cls.app = Flask(__name__)
+        cls.app.config["TESTING"] = True
+        cls.app.config["SECRET_KEY"] = "test-secret-key"
 
         # Mock static folder
-        self.app.static_folder = os.path.join(
+        cls.app.static_folder = os.path.join(
             os.path.dirname(os.path.dirname(__file__)), "data", "static"
         )
 
-        self.app.register_blueprint(pwa_bp)
-        self.client = self.app.test_client()
+        cls.app.register_blueprint(pwa_bp)
+        cls.client = cls.app.test_client()
 
     def test_manifest_route(self):
         """Test /manifest.json route"""
@@ -166,7 +167,7 @@ class TestPWARoutes(unittest.TestCase):
         self.assertEqual(response.content_type, "application/json")
 
         # Test that response is valid JSON
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIsInstance(data, dict)
 
     def test_service_worker_route(self):
@@ -184,7 +185,7 @@ class TestPWARoutes(unittest.TestCase):
         response = self.client.get("/api/pwa/status")
         self.assertEqual(response.status_code, 200)
 
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertTrue(data.get("success"))
         self.assertTrue(data.get("pwa_enabled"))
         self.assertIn("capabilities", data)
@@ -206,7 +207,7 @@ class TestPWARoutes(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 200)
 
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertTrue(data.get("success"))
 
     def test_cache_stats_route(self):
@@ -214,7 +215,7 @@ class TestPWARoutes(unittest.TestCase):
         response = self.client.get("/api/pwa/cache-stats")
         self.assertEqual(response.status_code, 200)
 
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertTrue(data.get("success"))
         self.assertIn("stats", data)
 
@@ -224,7 +225,7 @@ class TestPWARoutes(unittest.TestCase):
         response = self.client.get("/api/push/vapid-key")
         self.assertEqual(response.status_code, 200)
 
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertTrue(data.get("success"))
         self.assertIn("publicKey", data)
 
@@ -241,7 +242,7 @@ class TestPWARoutes(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 200)
 
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertTrue(data.get("success"))
 
 
@@ -12,9 +12,9 @@ from flask import Flask
 from src.routes.pwa_routes import pwa_bp
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app():
-    """Create test Flask app with PWA blueprint"""
+    """Create test Flask app with PWA blueprint, shared by the module's tests"""
     app = Flask(__name__)
     app.config["TESTING"] = True
     app.config["SECRET_KEY"] = "test-secret-key"
@@ -22,7 +22,7 @@ def app():
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
     """Create test client"""
     return app.test_client()
@@ -45,7 +45,7 @@ class TestPWAManifest:
 
         assert response.status_code == 200
         assert response.content_type == "application/manifest+json; charset=utf-8"
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["name"] == "Video Transcriber"
         assert data["display"] == "standalone"
 
@@ -55,7 +55,7 @@ class TestPWAManifest:
             response = client.get("/manifest.json")
 
         assert response.status_code == 404
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["error"] == "Manifest not found"
 
 
@@ -99,7 +99,7 @@ class TestPWAStatus:
         response = client.get("/api/pwa/status")
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is True
         assert data["pwa_enabled"] is True
@@ -120,7 +120,7 @@ class TestPWAStatus:
         )
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["capabilities"]["camera_access"] is True
         assert data["capabilities"]["share_api"] is True
@@ -132,7 +132,7 @@ class TestPWAStatus:
         )
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["is_standalone"] is True
 
@@ -149,7 +149,7 @@ class TestInstallStats:
         )
 
         assert response.status_code == 200
-        result = json.loads(response.data)
+        result = response.get_json()
         assert result["success"] is True
         assert result["event_type"] == "prompt_shown"
 
@@ -162,7 +162,7 @@ class TestInstallStats:
         )
 
         assert response.status_code == 200
-        result = json.loads(response.data)
+        result = response.get_json()
         assert result["success"] is True
         assert result["event_type"] == "install_accepted"
 
@@ -171,7 +171,7 @@ class TestInstallStats:
         response = client.post("/api/pwa/install-stats")
 
         assert response.status_code == 200
-        result = json.loads(response.data)
+        result = response.get_json()
         assert result["success"] is True
 
 
@@ -183,7 +183,7 @@ class TestCacheStats:
         response = client.get("/api/pwa/cache-stats")
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is True
         assert "stats" in data
@@ -204,7 +204,7 @@ class TestPushNotifications:
         response = client.get("/api/push/vapid-key")
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is True
         assert "publicKey" in data
@@ -224,7 +224,7 @@ class TestPushNotifications:
         )
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is True
         assert "subscription_id" in data
@@ -234,7 +234,7 @@ class TestPushNotifications:
         response = client.post("/api/push/subscribe")
 
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is False
         assert "error" in data
@@ -248,7 +248,7 @@ class TestPushNotifications:
         )
 
         assert response.status_code == 200
-        result = json.loads(response.data)
+        result = response.get_json()
 
         assert result["success"] is True
 
@@ -259,7 +259,7 @@ class TestPushNotifications:
         )
 
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is False
 
@@ -272,7 +272,7 @@ class TestOfflineQueue:
         response = client.get("/api/pwa/offline-queue")
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is True
         assert "queue" in data
@@ -293,7 +293,7 @@ class TestOfflineQueue:
         )
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is True
         assert "queue_id" in data
@@ -303,7 +303,7 @@ class TestOfflineQueue:
         response = client.post("/api/pwa/offline-queue")
 
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is False
 
@@ -316,7 +316,7 @@ class TestCacheManagement:
         response = client.post("/api/pwa/clear-cache")
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is True
         assert "message" in data
@@ -326,7 +326,7 @@ class TestCacheManagement:
         response = client.get("/api/pwa/update-check")
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is True
         assert "update_available" in data
@@ -357,7 +357,7 @@ class TestErrorHandlers:
         response = client.get("/api/pwa/nonexistent")
 
         assert response.status_code == 404
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert data["success"] is False
         assert data["error"] == "PWA resource not found"
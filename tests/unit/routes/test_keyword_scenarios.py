@@ -1,6 +1,5 @@
 """Tests for keyword scenario API endpoints."""
 
-import json
 import unittest
 from unittest.mock import patch
 
@@ -10,14 +9,15 @@ from src.routes.api import api_bp
 class TestKeywordScenariosAPI(unittest.TestCase):
     """Test cases for keyword scenarios API endpoints."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up one Flask app and test client for the whole class."""
         from flask import Flask
 
-        self.app = Flask(__name__)
-        self.app.register_blueprint(api_bp)
-        self.app.config["TESTING"] = True
-        self.client = self.app.test_client()
+        cls.app = Flask(__name__)
+        cls.app.register_blueprint(api_bp)
+        cls.app.config["TESTING"] = True
+        cls.client = cls.app.test_client()
 
     def test_get_keyword_scenarios_success(self):
         """Test successful retrieval of keyword scenarios."""
@@ -40,7 +40,7 @@ class TestKeywordScenariosAPI(unittest.TestCase):
             response = self.client.get("/api/keywords/scenarios")
 
             self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
+            data = response.get_json()
 
             self.assertTrue(data["success"])
             self.assertEqual(len(data["scenarios"]), 2)
@@ -57,7 +57,7 @@ class TestKeywordScenariosAPI(unittest.TestCase):
             response = self.client.get("/api/keywords/scenarios")
 
             self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
+            data = response.get_json()
 
             self.assertTrue(data["success"])
             self.assertEqual(len(data["scenarios"]), 0)
@@ -75,7 +75,7 @@ class TestKeywordScenariosAPI(unittest.TestCase):
             response = self.client.get("/api/keywords/scenarios/education")
 
             self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
+            data = response.get_json()
 
             self.assertTrue(data["success"])
             self.assertEqual(data["scenario"]["id"], "education")
@@ -87,7 +87,7 @@ class TestKeywordScenariosAPI(unittest.TestCase):
             response = self.client.get("/api/keywords/scenarios/nonexistent")
 
             self.assertEqual(response.status_code, 400)
-            data = json.loads(response.data)
+            data = response.get_json()
 
             self.assertFalse(data["success"])
             self.assertIn("not found", data["error"])
@@ -110,7 +110,7 @@ class TestKeywordScenariosAPI(unittest.TestCase):
             )
 
             self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
+            data = response.get_json()
 
             self.assertTrue(data["success"])
             self.assertEqual(len(data["keywords"]), 3)
@@ -139,7 +139,7 @@ class TestKeywordScenariosAPI(unittest.TestCase):
             )
 
             self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
+            data = response.get_json()
 
             self.assertTrue(data["success"])
             # Should have merged keywords (5 unique)
@@ -157,7 +157,7 @@ class TestKeywordScenariosAPI(unittest.TestCase):
         )  # Missing scenario_id
 
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = response.get_json()
 
         self.assertFalse(data["success"])
         self.assertIn("scenario_id", data["error"])
@@ -170,7 +170,7 @@ class TestKeywordScenariosAPI(unittest.TestCase):
             )
 
             self.assertEqual(response.status_code, 400)
-            data = json.loads(response.data)
+            data = response.get_json()
 
             self.assertFalse(data["success"])
             self.assertIn("not found", data["error"])
@@ -7,6 +7,7 @@ to ensure reliable concurrent video processing.
 
 import json
 import os
+import shutil
 import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
@@ -26,6 +27,7 @@ class TestBatchProcessing(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
         self.processor = BatchProcessor(results_dir=self.temp_dir)
 
         # Mock transcriber
@@ -36,12 +38,6 @@ class TestBatchProcessing(unittest.TestCase):
         }
         self.processor.set_transcriber(self.mock_transcriber)
 
-    def tearDown(self):
-        """Clean up test environment."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_create_batch(self):
         """Test batch creation."""
         batch_id = self.processor.create_batch(name="Test Batch", max_concurrent=3)
@@ -2,6 +2,7 @@
 
 import json
 import os
+import shutil
 import tempfile
 import unittest
 from unittest.mock import patch
@@ -21,14 +22,7 @@ class TestKeywordUtilities(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.test_dir = tempfile.mkdtemp()
-        self.addCleanup(lambda: self._cleanup_test_dir())
-
-    def _cleanup_test_dir(self):
-        """Clean up test directory."""
-        import shutil
-
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
 
     def test_load_keywords_empty_file(self):
         """Test loading keywords when file doesn't exist."""
@@ -17,6 +17,7 @@ from src.utils.session import (
     ensure_session_exists,
     get_session_list,
     validate_session_access,
+    validate_session_access_batch,
     validate_session_for_socket,
 )
 
@@ -35,37 +36,31 @@ class TestValidateSessionAccess:
         assert result == expected_path
 
     @pytest.mark.unit
-    def test_invalid_session_id_format(self, test_directories):
-        """Test validation with invalid session ID format."""
-        invalid_ids = [
+    @pytest.mark.parametrize(
+        "invalid_id",
+        [
             "../malicious",
             "session with spaces",
             "session/with/slashes",
             "session\\with\\backslashes",
             "",
             None,
-        ]
-
-        results_folder = test_directories["results"]
-
-        for invalid_id in invalid_ids:
-            with pytest.raises(UserFriendlyError, match="Invalid session ID"):
-                validate_session_access(invalid_id, results_folder)
+        ],
+    )
+    def test_invalid_session_id_format(self, test_directories, invalid_id):
+        """Test validation with invalid session ID format."""
+        with pytest.raises(UserFriendlyError, match="Invalid session ID"):
+            validate_session_access(invalid_id, test_directories["results"])
 
     @pytest.mark.unit
-    def test_path_traversal_protection(self, test_directories):
+    @pytest.mark.parametrize(
+        "malicious_id",
+        ["../../etc/passwd", "..%2F..%2Fetc%2Fpasswd", "../../../root"],
+    )
+    def test_path_traversal_protection(self, test_directories, malicious_id):
         """Test protection against path traversal attacks."""
-        malicious_ids = [
-            "../../etc/passwd",
-            "..%2F..%2Fetc%2Fpasswd",
-            "../../../root",
-        ]
-
-        results_folder = test_directories["results"]
-
-        for malicious_id in malicious_ids:
-            with pytest.raises(UserFriendlyError):
-                validate_session_access(malicious_id, results_folder)
+        with pytest.raises(UserFriendlyError):
+            validate_session_access(malicious_id, test_directories["results"])
 
     @pytest.mark.unit
     def test_default_results_folder(self):
@@ -80,6 +75,39 @@ class TestValidateSessionAccess:
             assert result == expected_path
 
 
+class TestValidateSessionAccessBatch:
+    """Test batched session access validation."""
+
+    @pytest.mark.unit
+    def test_mixed_session_ids(self, test_directories):
+        """Test batch validation returns one flag per session ID."""
+        session_ids = ["valid_session_123", "../malicious", "", None, "session-2"]
+
+        result = validate_session_access_batch(session_ids, test_directories["results"])
+        assert result == [True, False, False, False, True]
+
+    @pytest.mark.unit
+    def test_matches_single_validation(self, test_directories):
+        """Test batch results agree with validate_session_access."""
+        results_folder = test_directories["results"]
+        session_ids = ["session_a", "session/slash", "..%2Fetc", "Session-B_1"]
+
+        expected = []
+        for session_id in session_ids:
+            try:
+                validate_session_access(session_id, results_folder)
+                expected.append(True)
+            except UserFriendlyError:
+                expected.append(False)
+
+        assert validate_session_access_batch(session_ids, results_folder) == expected
+
+    @pytest.mark.unit
+    def test_empty_batch(self, test_directories):
+        """Test batch validation of no session IDs."""
+        assert validate_session_access_batch([], test_directories["results"]) == []
+
+
 class TestEnsureSessionExists:
     """Test session existence validation with metadata loading."""
 
@@ -96,7 +124,7 @@ class TestEnsureSessionExists:
         # Create metadata file
         metadata_file = os.path.join(session_dir, "metadata.json")
         with open(metadata_file, "w") as f:
-            json.dump(sample_session_metadata, f)
+            json.dump(dict(sample_session_metadata), f)
 
         session_path, metadata = ensure_session_exists(session_id, results_folder)
 
@@ -153,24 +181,18 @@ class TestValidateSessionForSocket:
     """Test socket session validation."""
 
     @pytest.mark.unit
-    def test_valid_socket_session_ids(self):
+    @pytest.mark.parametrize(
+        "valid_id",
+        ["session123", "session_123", "session-123", "Session_123-Test", "a", "123"],
+    )
+    def test_valid_socket_session_ids(self, valid_id):
         """Test validation of valid session IDs for sockets."""
-        valid_ids = [
-            "session123",
-            "session_123",
-            "session-123",
-            "Session_123-Test",
-            "a",
-            "123",
-        ]
-
-        for valid_id in valid_ids:
-            assert validate_session_for_socket(valid_id) is True
+        assert validate_session_for_socket(valid_id) is True
 
     @pytest.mark.unit
-    def test_invalid_socket_session_ids(self):
-        """Test validation of invalid session IDs for sockets."""
-        invalid_ids = [
+    @pytest.mark.parametrize(
+        "invalid_id",
+        [
             "",
             None,
             "session with spaces",
@@ -179,10 +201,11 @@ class TestValidateSessionForSocket:
             "session.dot",
             "session@symbol",
             "../traversal",
-        ]
-
-        for invalid_id in invalid_ids:
-            assert validate_session_for_socket(invalid_id) is False
+        ],
+    )
+    def test_invalid_socket_session_ids(self, invalid_id):
+        """Test validation of invalid session IDs for sockets."""
+        assert validate_session_for_socket(invalid_id) is False
 
 
 class TestGetSessionList: